@@ -26,11 +26,28 @@ async def main():
 
 asyncio.run(main())
 ```
+
+Для ускорения event loop можно включить uvloop (если он установлен).
+Вызов должен быть сделан до asyncio.run(...):
+```python
+from kaiten_client import KaitenConfig
+
+KaitenConfig.install_event_loop(use_uvloop=True)
+asyncio.run(main())
+```
 """
 
 from .kaiten_client import KaitenClient
-from .config import KaitenConfig
-from .exceptions import KaitenApiError, KaitenNotFoundError, KaitenValidationError
+from .config import KaitenConfig, KaitenRuntimeConfig
+from .exceptions import (
+    KaitenApiError,
+    KaitenNotFoundError,
+    KaitenValidationError,
+    KaitenAuthenticationError,
+    KaitenPermissionError,
+    KaitenRateLimitError,
+    KaitenServerError
+)
 
 __version__ = "2.0.0"
 __author__ = "Rimuwu"
@@ -38,7 +55,12 @@ __author__ = "Rimuwu"
 __all__ = [
     "KaitenClient",
     "KaitenConfig", 
+    "KaitenRuntimeConfig",
     "KaitenApiError",
     "KaitenNotFoundError",
-    "KaitenValidationError"
+    "KaitenValidationError",
+    "KaitenAuthenticationError",
+    "KaitenPermissionError",
+    "KaitenRateLimitError",
+    "KaitenServerError"
 ]
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Пакетное выполнение запросов Kaiten клиента.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+from .config import KaitenConfig
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+async def _gather_bounded(func: Callable[[T], Awaitable[R]], items: Iterable[T],
+                          concurrency: int = KaitenConfig.BULK_CONCURRENCY) -> List[R]:
+    """
+    Вызывает func для каждого элемента параллельно, не более `concurrency` вызовов одновременно.
+    
+    Returns:
+        Результаты в порядке items
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency должен быть положительным")
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+    
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+class RequestBatch:
+    """
+    Накопитель запросов, которые выполняются одновременно при выходе из блока.
+
+    Вызовы методов клиента внутри блока только регистрируются, а при выходе
+    запускаются все сразу через asyncio.gather: запросы уходят параллельно
+    по пулу соединений, и N независимых запросов занимают время одного
+    (в пределах лимита запросов в секунду).
+
+    Пример:
+        async with client.batch() as batch:
+            boards = batch.add(client.get_boards(space_id))
+            columns = batch.add(client.get_columns(board_id))
+        print(boards.result(), columns.result())
+    """
+
+    __slots__ = ('_awaitables', '_futures')
+
+    def __init__(self):
+        self._awaitables: List[Awaitable[Any]] = []
+        self._futures: List[asyncio.Future] = []
+
+    def add(self, awaitable: Awaitable[Any]) -> asyncio.Future:
+        """
+        Регистрирует запрос в пакете.
+
+        Returns:
+            Future, результат которого будет доступен после выхода из блока
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._awaitables.append(awaitable)
+        self._futures.append(future)
+        return future
+
+    async def __aenter__(self) -> 'RequestBatch':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        awaitables, self._awaitables = self._awaitables, []
+        futures, self._futures = self._futures, []
+
+        if exc_type is not None:
+            # Блок завершился ошибкой - запросы не отправляем
+            for awaitable in awaitables:
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()
+            for future in futures:
+                future.cancel()
+            return
+
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+
+        first_error = None
+        for future, result in zip(futures, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+                if first_error is None:
+                    first_error = result
+            else:
+                future.set_result(result)
+
+        if first_error is not None:
+            # Ошибки остальных запросов доступны через их future
+            for future in futures:
+                if future.done() and not future.cancelled():
+                    future.exception()
+            raise first_error
@@ -0,0 +1,124 @@
+"""
+Кэш ответов API для Kaiten клиента.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    In-memory кэш ответов GET запросов с TTL и stale-while-revalidate.
+
+    Запись свежая в течение `ttl` секунд, затем ещё `stale` секунд считается
+    устаревшей: её можно отдать сразу, обновив в фоне. После этого запись ещё
+    `stale_if_error` секунд хранится на случай ошибки сервера или сети. Ключ -
+    кортеж, первым элементом которого является эндпоинт (по нему работает инвалидация).
+    """
+
+    def __init__(self, max_entries: int = 1024, stale_if_error: float = 0.0):
+        """
+        Args:
+            max_entries: Максимальное количество записей (старые вытесняются первыми)
+            stale_if_error: Сколько секунд после устаревания запись можно отдать
+                вместо ошибки сервера или сети
+        """
+        self.max_entries = max_entries
+        self.stale_if_error = stale_if_error
+        self._entries: Dict[Hashable, Tuple[float, float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Возвращает (значение, свежее ли оно) или None, если записи нет или она истекла.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        fresh_until, stale_until, value = entry
+        now = time.monotonic()
+        if now < fresh_until:
+            return value, True
+        if now < stale_until:
+            return value, False
+
+        if now >= stale_until + self.stale_if_error:
+            del self._entries[key]
+        return None
+
+    def get_on_error(self, key: Hashable) -> Optional[Tuple[Any]]:
+        """
+        Возвращает (значение,) для ответа вместо ошибки или None.
+        
+        Подходит любая запись, срок хранения которой на случай ошибки не истёк.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1] + self.stale_if_error:
+            del self._entries[key]
+            return None
+        return (entry[2],)
+
+    def put(self, key: Hashable, value: Any, ttl: float, stale: float = 0.0) -> None:
+        """Сохраняет значение на `ttl` секунд плюс `stale` секунд устаревания."""
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + ttl, now + ttl + stale, value)
+
+        # Словарь хранит порядок вставки - первыми вытесняются самые старые записи
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, prefix: str) -> None:
+        """Удаляет все записи, эндпоинт которых начинается с `prefix`."""
+        stale_keys = [key for key in self._entries if key[0].startswith(prefix)]
+        for key in stale_keys:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        self._entries.clear()
+
+
+class ETagCache:
+    """
+    Хранилище последних ответов GET запросов вместе с их ETag.
+
+    Используется для условных запросов (If-None-Match): при ответе 304 Not Modified
+    тело берётся отсюда, а свежесть данных подтверждает сам сервер. Клиент хранит
+    здесь сырое тело ответа (bytes) и разбирает его заново на каждый ответ 304.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Максимальное количество записей (давно не использованные вытесняются первыми)
+        """
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[str, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, Any]]:
+        """Возвращает (etag, значение) или None."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            # Переносим в конец - запись использовалась недавно
+            self._entries[key] = entry
+        return entry
+
+    def put(self, key: Hashable, etag: str, value: Any) -> None:
+        """Сохраняет значение с его ETag."""
+        self._entries.pop(key, None)
+        self._entries[key] = (etag, value)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, prefix: str) -> None:
+        """Удаляет все записи, эндпоинт которых начинается с `prefix`."""
+        stale_keys = [key for key in self._entries if key[0].startswith(prefix)]
+        for key in stale_keys:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Очищает хранилище."""
+        self._entries.clear()
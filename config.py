@@ -2,74 +2,246 @@
 Конфигурационные настройки для Kaiten API клиента.
 """
 
+import functools
+import json
+import string
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Final, Literal, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Сериализует объект в JSON (UTF-8 bytes) средствами стандартной библиотеки."""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
-@dataclass
 class KaitenConfig:
-    """Конфигурация для Kaiten API клиента."""
+    """
+    Неизменяемые константы Kaiten API клиента.
+    
+    Используется как пространство имён и не предназначен для создания экземпляров.
+    Настройки, которые можно менять для конкретного клиента, вынесены в KaitenRuntimeConfig.
+    """
     
     # API Settings
-    BASE_URL: str = "https://api.kaiten.ru"
-    MAX_RETRIES = 3
-    RETRY_DELAY = 1.0  # seconds
-    DEFAULT_TIMEOUT = 30  # seconds
-    API_VERSION = "v1"
+    BASE_URL: Final = "https://api.kaiten.ru"
+    MAX_RETRIES: Final = 3
+    RETRY_DELAY: Final = 1.0  # seconds, базовая задержка перед повтором
+    RETRY_CAP: Final = 30.0  # seconds, максимальная задержка перед повтором
+    DEFAULT_TIMEOUT: Final = 30  # seconds
+    CONNECT_TIMEOUT: Final = 5  # seconds
+    API_VERSION: Final = "v1"
+    USER_AGENT: Final = "kaiten-client"
+
+    # Connection Pool
+    POOL_CONNECTIONS: Final = 100
+    POOL_PER_HOST: Final = 100
+    KEEPALIVE_TIMEOUT: Final = 60  # seconds
+    POOL_ACQUIRE_TIMEOUT: Final = 1.0  # seconds
+    DNS_CACHE_TTL: Final = 300  # seconds
+    # Одновременных запросов не больше, чем соединений в пуле
+    MAX_CONCURRENCY: Final = POOL_CONNECTIONS
+    # Одновременных запросов в пакетных операциях (bulk_*)
+    BULK_CONCURRENCY: Final = 8
+    # Загрузка всех страниц карточек: размер страницы (лимит API) и страниц за раз
+    CARDS_PAGE_SIZE: Final = 100
+    PAGE_CONCURRENCY: Final = 3
 
     # Rate Limiting (согласно документации Kaiten)
-    LIMIT_PER_SEC = 3
+    LIMIT_PER_SEC: Final = 3
+    # Алгоритм ограничения: "token_bucket" или "sliding_window"
+    RATE_LIMIT_ALGO: Final = "sliding_window"
+    # Быстрый режим для пакетной обработки: без лимита запросов и без повторов
+    FAST_MODE: Final = False
+
+    # Кэш ответов GET запросов (по умолчанию выключен)
+    RESPONSE_CACHE: Final = False
+    CACHE_MAX_ENTRIES: Final = 1024
+    # Политики кэширования (ttl, stale) в секундах: запись свежая ttl секунд,
+    # затем ещё stale секунд отдаётся сразу с обновлением в фоне
+    CACHE_VOLATILE: Final = (5.0, 30.0)  # карточки и их комментарии, участники, файлы
+    CACHE_LIST: Final = (120.0, 600.0)
+    CACHE_ENTITY: Final = (300.0, 900.0)
+    # Сколько секунд после устаревания запись отдаётся вместо ошибки сервера или сети
+    CACHE_STALE_IF_ERROR: Final = 3600.0
+
+    # Сколько секунд хранится словарь {название кастомного свойства: ID}
+    PROPERTY_NAMES_TTL: Final = 300.0
+
+    # Условные GET запросы (ETag / If-None-Match) для отдельных ресурсов
+    CONDITIONAL_GET: Final = True
+    ETAG_CACHE_SIZE: Final = 256
+
+    # Пакетная загрузка одновременных get_card одним запросом get_cards (по умолчанию выключена)
+    BATCH_GET_CARD: Final = False
+    CARD_BATCH_WINDOW: Final = 0.005  # seconds, окно накопления запросов
+    CARD_BATCH_MAX: Final = 100  # максимум карточек в одном запросе (лимит API)
+
+    # Использовать uvloop (если установлен) вместо стандартного event loop
+    USE_UVLOOP: Final = False
+
+    # Сериализация тела запросов: orjson (если установлен) сразу отдаёт bytes
+    JSON_ENCODER: Final = staticmethod(orjson.dumps if orjson is not None else _json_dumps)
+    # Разбор ответов: orjson (если установлен) читает bytes без промежуточной str
+    JSON_DECODER: Final = staticmethod(orjson.loads if orjson is not None else json.loads)
+
+    # Размер LRU кэша готовых путей для каждой функции ENDPOINT_*_FMT
+    ENDPOINT_CACHE_SIZE: Final = 1024
 
     # API Endpoints
     # Основные ресурсы
-    ENDPOINT_SPACES: str = "/spaces"
-    ENDPOINT_BOARDS: str = "/spaces/{space_id}/boards"
-    ENDPOINT_COLUMNS: str = "/boards/{board_id}/columns"
-    ENDPOINT_LANES: str = "/boards/{board_id}/lanes"
-    ENDPOINT_CARDS: str = "/cards"
-    ENDPOINT_TAGS: str = "/tags"
-    ENDPOINT_USERS: str = "/users"
-    ENDPOINT_CURRENT_USER: str = "/users/current"
+    ENDPOINT_SPACES: Final = "/spaces"
+    ENDPOINT_BOARDS: Final = "/spaces/{space_id}/boards"
+    ENDPOINT_COLUMNS: Final = "/boards/{board_id}/columns"
+    ENDPOINT_LANES: Final = "/boards/{board_id}/lanes"
+    ENDPOINT_CARDS: Final = "/cards"
+    ENDPOINT_TAGS: Final = "/tags"
+    ENDPOINT_USERS: Final = "/users"
+    ENDPOINT_CURRENT_USER: Final = "/users/current"
     
     # Карточки и связанные ресурсы
-    ENDPOINT_CARD_COMMENTS: str = "/cards/{card_id}/comments"
-    ENDPOINT_CARD_FILES: str = "/cards/{card_id}/files"
-    ENDPOINT_CARD_MEMBERS: str = "/cards/{card_id}/members"
-    ENDPOINT_CARD_CHILDREN: str = "/cards/{card_id}/children"
-    ENDPOINT_CARD_TIME_LOGS: str = "/cards/{card_id}/time-logs"
-    ENDPOINT_CARD_CHECKLISTS: str = "/cards/{card_id}/checklists"
+    ENDPOINT_CARD_COMMENTS: Final = "/cards/{card_id}/comments"
+    ENDPOINT_CARD_FILES: Final = "/cards/{card_id}/files"
+    ENDPOINT_CARD_MEMBERS: Final = "/cards/{card_id}/members"
+    ENDPOINT_CARD_CHILDREN: Final = "/cards/{card_id}/children"
+    ENDPOINT_CARD_TIME_LOGS: Final = "/cards/{card_id}/time-logs"
+    ENDPOINT_CARD_CHECKLISTS: Final = "/cards/{card_id}/checklists"
+    ENDPOINT_CARD_PROPERTIES: Final = "/cards/{card_id}/properties"
     
     # Чеклисты
-    ENDPOINT_CHECKLISTS: str = "/checklists"
-    ENDPOINT_CHECKLIST_ITEMS: str = "/cards/{card_id}/checklists/{checklist_id}/items"
+    ENDPOINT_CHECKLISTS: Final = "/checklists"
+    ENDPOINT_CHECKLIST_ITEMS: Final = "/cards/{card_id}/checklists/{checklist_id}/items"
     
     # Файлы
-    ENDPOINT_FILES: str = "/files"
+    ENDPOINT_FILES: Final = "/files"
     
     # Типы карточек
-    ENDPOINT_CARD_TYPES: str = "/card-types"
+    ENDPOINT_CARD_TYPES: Final = "/card-types"
     
     # Пользовательские свойства
-    ENDPOINT_CUSTOM_PROPERTIES: str = "/company/custom-properties"
+    ENDPOINT_CUSTOM_PROPERTIES: Final = "/company/custom-properties"
+    ENDPOINT_PROPERTY_SELECT_VALUES: Final = "/company/custom-properties/{property_id}/select-values"
+
+    @classmethod
+    def build_endpoint_formatters(cls) -> None:
+        """
+        Создаёт для каждого шаблона ENDPOINT_* с подстановками функцию ENDPOINT_*_FMT.
+        
+        Шаблон разбирается один раз при импорте, а функция лишь склеивает
+        готовые куски строки с переданными ID (в порядке их появления в шаблоне),
+        например: KaitenConfig.ENDPOINT_BOARDS_FMT(space_id). Результаты кэшируются
+        (LRU), так как одни и те же ID обычно запрашиваются многократно.
+        """
+        cache = functools.lru_cache(maxsize=cls.ENDPOINT_CACHE_SIZE)
+        for name, template in list(vars(cls).items()):
+            if name.startswith('ENDPOINT_') and isinstance(template, str) and '{' in template:
+                setattr(cls, f'{name}_FMT', staticmethod(cache(_compile_endpoint(template))))
+
+    @staticmethod
+    def install_event_loop(use_uvloop: Optional[bool] = None) -> bool:
+        """
+        Устанавливает uvloop в качестве политики event loop.
+        
+        Должен вызываться до asyncio.run(...). uvloop - необязательная зависимость:
+        если он не установлен, используется стандартный event loop.
+        
+        Args:
+            use_uvloop: Включить uvloop (по умолчанию значение USE_UVLOOP)
+        
+        Returns:
+            True если uvloop установлен
+        """
+        if use_uvloop is None:
+            use_uvloop = KaitenConfig.USE_UVLOOP
+        if not use_uvloop:
+            return False
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        uvloop.install()
+        return True
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def get_base_url(domain: str) -> str:
-        """Формирует базовый URL для API."""
+        """Формирует базовый URL для API (результат кэшируется по домену)."""
         if not domain:
             raise ValueError("Domain не может быть пустым")
         
         # Убираем возможные протоколы и слеши
-        domain = domain.strip().replace("https://", "").replace("http://", "").rstrip("/")
+        domain = domain.strip().removeprefix("https://").removeprefix("http://").rstrip("/")
         
         # Добавляем .kaiten.ru если это не полный домен
         if not domain.endswith(".kaiten.ru"):
             domain = f"{domain}.kaiten.ru"
         
-        return f"https://{domain}/api/{KaitenConfig.API_VERSION}"
+        return "https://" + domain + _API_PATH
+
+
+# Путь API с версией, собирается один раз при импорте
+_API_PATH: Final = f"/api/{KaitenConfig.API_VERSION}"
+
+
+def _compile_endpoint(template: str) -> Callable[..., str]:
+    """Компилирует шаблон эндпоинта в функцию, склеивающую строку без разбора формата."""
+    parts = list(string.Formatter().parse(template))
+    literals = [literal for literal, _, _, _ in parts]
+    field_count = sum(1 for _, field, _, _ in parts if field is not None)
+    
+    if field_count == 1:
+        prefix = literals[0]
+        suffix = ''.join(literals[1:])
+        
+        def format_endpoint(value) -> str:
+            return prefix + str(value) + suffix
+        return format_endpoint
+    
+    def format_endpoint(*values) -> str:
+        if len(values) != field_count:
+            raise TypeError(f"Ожидается {field_count} аргументов для шаблона '{template}'")
+        chunks = []
+        for literal, value in zip(literals, values):
+            chunks.append(literal)
+            chunks.append(str(value))
+        chunks.extend(literals[field_count:])
+        return ''.join(chunks)
+    return format_endpoint
+
+
+KaitenConfig.build_endpoint_formatters()
+
+
+@dataclass(slots=True, frozen=True)
+class KaitenRuntimeConfig:
+    """
+    Настраиваемые параметры работы клиента.
+    
+    Значения по умолчанию берутся из констант KaitenConfig.
+    """
+    
+    max_retries: int = KaitenConfig.MAX_RETRIES
+    retry_delay: float = KaitenConfig.RETRY_DELAY  # seconds
+    retry_cap: float = KaitenConfig.RETRY_CAP  # seconds
+    timeout: int = KaitenConfig.DEFAULT_TIMEOUT  # seconds
+    limit_per_sec: int = KaitenConfig.LIMIT_PER_SEC
+    rate_limit_algo: Literal["token_bucket", "sliding_window"] = KaitenConfig.RATE_LIMIT_ALGO
+    fast_mode: bool = KaitenConfig.FAST_MODE
+    max_concurrency: int = KaitenConfig.MAX_CONCURRENCY
+    response_cache: bool = KaitenConfig.RESPONSE_CACHE
+    conditional_get: bool = KaitenConfig.CONDITIONAL_GET
+    batch_get_card: bool = KaitenConfig.BATCH_GET_CARD
 
 
 class KaitenCredentials:
     """Управление учетными данными для Kaiten API."""
+
+    __slots__ = ('_domain', '_token', '_base_url', '_headers', '_session_headers', '_upload_headers')
     
     def __init__(self, domain: str, token: str):
         if not domain or not domain.strip():
@@ -79,6 +251,26 @@ class KaitenCredentials:
         
         self._domain = domain.strip()
         self._token = token.strip()
+        self._base_url = KaitenConfig.get_base_url(self._domain)
+
+        # Заголовки не меняются после создания, поэтому собираем их один раз
+        self._headers = MappingProxyType({
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {self._token}',
+        })
+        self._upload_headers = MappingProxyType({
+            'Authorization': f'Bearer {self._token}',
+        })
+        # Заголовки сессии без Content-Type: его задаёт каждый запрос по своему телу
+        # (application/json или multipart/form-data при загрузке файлов).
+        # Accept-Encoding не задаём: aiohttp сам перечисляет только те алгоритмы
+        # сжатия, которые умеет распаковать (gzip, deflate, br при наличии brotli)
+        self._session_headers = MappingProxyType({
+            'Accept': 'application/json',
+            'Authorization': f'Bearer {self._token}',
+            'User-Agent': KaitenConfig.USER_AGENT,
+        })
     
     @property
     def domain(self) -> str:
@@ -90,18 +282,27 @@ class KaitenCredentials:
     
     @property
     def base_url(self) -> str:
-        return KaitenConfig.get_base_url(self._domain)
+        return self._base_url
     
-    def get_headers(self) -> dict:
-        """Возвращает заголовки для HTTP запросов."""
-        return {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self._token}',
-        }
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Заголовки для HTTP запросов (только для чтения)."""
+        return self._headers
     
-    def get_upload_headers(self) -> dict:
-        """Возвращает заголовки для загрузки файлов."""
-        return {
-            'Authorization': f'Bearer {self._token}',
-        }
\ No newline at end of file
+    @property
+    def session_headers(self) -> Mapping[str, str]:
+        """Заголовки по умолчанию для HTTP сессии (только для чтения)."""
+        return self._session_headers
+    
+    @property
+    def upload_headers(self) -> Mapping[str, str]:
+        """Заголовки для загрузки файлов (только для чтения)."""
+        return self._upload_headers
+    
+    def get_headers(self) -> Mapping[str, str]:
+        """Возвращает заголовки для HTTP запросов (алиас для headers)."""
+        return self._headers
+    
+    def get_upload_headers(self) -> Mapping[str, str]:
+        """Возвращает заголовки для загрузки файлов (алиас для upload_headers)."""
+        return self._upload_headers
\ No newline at end of file
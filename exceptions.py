@@ -2,64 +2,141 @@
 Исключения для Kaiten API клиента.
 """
 
+from http import HTTPStatus
+from typing import Any, ClassVar, Dict, Optional, Type
+
 
 class KaitenApiError(Exception):
     """Базовое исключение для ошибок Kaiten API."""
+
+    __slots__ = ('status_code', 'response_data')
+
+    # Имеет ли смысл повторять запрос, завершившийся этой ошибкой
+    RETRYABLE: ClassVar[bool] = False
     
     def __init__(self, message: str, status_code: int = None, response_data: dict = None):
         super().__init__(message)
-        self.message = message
         self.status_code = status_code
         self.response_data = response_data
 
+    @property
+    def message(self) -> str:
+        """Текст ошибки (хранится в args[0], как у любого Exception)."""
+        return self.args[0]
+
+    @classmethod
+    def from_response(cls, status: int, data: Any = None,
+                      endpoint: Optional[str] = None) -> 'KaitenApiError':
+        """
+        Создаёт исключение, соответствующее HTTP статусу ответа.
+        
+        Args:
+            status: HTTP статус ответа
+            data: Тело ответа с ошибкой (разобранный JSON, текст или сырые байты)
+            endpoint: Эндпоинт запроса (для сообщения об ошибке)
+        
+        Returns:
+            Экземпляр подходящего подкласса KaitenApiError
+        """
+        if isinstance(data, (bytes, bytearray)):
+            # Сырое тело ответа, которое не удалось (или не нужно было) разобрать как JSON
+            data = data.decode('utf-8', errors='replace')
+        exc_cls = _STATUS_MAP.get(status)
+        if exc_cls is None:
+            exc_cls = KaitenServerError if status >= HTTPStatus.INTERNAL_SERVER_ERROR else KaitenApiError
+        exc = exc_cls._from_response(status, data, endpoint)
+        exc.response_data = data
+        return exc
+
+    @classmethod
+    def _from_response(cls, status: int, data: Any, endpoint: Optional[str]) -> 'KaitenApiError':
+        return cls(f"API error {status}: {data}", status_code=status)
+
 
 class KaitenNotFoundError(KaitenApiError):
     """Ошибка 404 - ресурс не найден."""
+
+    __slots__ = ('resource_id',)
     
     def __init__(self, message: str = "Resource not found", resource_id: str = None):
-        super().__init__(message, status_code=404)
+        super().__init__(message, status_code=HTTPStatus.NOT_FOUND)
         self.resource_id = resource_id
 
+    @classmethod
+    def _from_response(cls, status, data, endpoint):
+        return cls(f"Resource not found: {endpoint}")
+
 
 class KaitenValidationError(KaitenApiError):
     """Ошибка валидации данных (422)."""
+
+    __slots__ = ('errors',)
     
     def __init__(self, message: str = "Validation error", errors: dict = None):
-        super().__init__(message, status_code=422)
+        super().__init__(message, status_code=HTTPStatus.UNPROCESSABLE_ENTITY)
         self.errors = errors or {}
 
+    @classmethod
+    def _from_response(cls, status, data, endpoint):
+        return cls(f"Validation error: {data}", errors=data if isinstance(data, dict) else None)
+
 
 class KaitenAuthenticationError(KaitenApiError):
     """Ошибка аутентификации (401)."""
+
+    __slots__ = ()
     
     def __init__(self, message: str = "Authentication failed"):
-        super().__init__(message, status_code=401)
+        super().__init__(message, status_code=HTTPStatus.UNAUTHORIZED)
+
+    @classmethod
+    def _from_response(cls, status, data, endpoint):
+        return cls(f"Authentication failed: {data}")
 
 
 class KaitenPermissionError(KaitenApiError):
     """Ошибка доступа (403)."""
+
+    __slots__ = ()
     
     def __init__(self, message: str = "Permission denied"):
-        super().__init__(message, status_code=403)
+        super().__init__(message, status_code=HTTPStatus.FORBIDDEN)
+
+    @classmethod
+    def _from_response(cls, status, data, endpoint):
+        return cls(f"Permission denied: {endpoint}")
 
 
 class KaitenRateLimitError(KaitenApiError):
     """Ошибка превышения лимита запросов (429)."""
+
+    __slots__ = ('retry_after',)
+    RETRYABLE = True
     
     def __init__(self, message: str = "Rate limit exceeded", retry_after: int = None):
-        super().__init__(message, status_code=429)
+        super().__init__(message, status_code=HTTPStatus.TOO_MANY_REQUESTS)
         self.retry_after = retry_after
 
+    @classmethod
+    def _from_response(cls, status, data, endpoint):
+        return cls(f"Rate limit exceeded: {endpoint}")
+
 
 class KaitenServerError(KaitenApiError):
     """Ошибка сервера (5xx)."""
+
+    __slots__ = ()
+    RETRYABLE = True
     
-    def __init__(self, message: str = "Server error", status_code: int = 500):
+    def __init__(self, message: str = "Server error", status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR):
         super().__init__(message, status_code=status_code)
 
 
 class KaitenConnectionError(KaitenApiError):
     """Ошибка соединения с API."""
+
+    __slots__ = ()
+    RETRYABLE = True
     
     def __init__(self, message: str = "Connection error"):
         super().__init__(message)
@@ -67,6 +144,19 @@ class KaitenConnectionError(KaitenApiError):
 
 class KaitenTimeoutError(KaitenApiError):
     """Ошибка таймаута запроса."""
+
+    __slots__ = ()
+    RETRYABLE = True
     
     def __init__(self, message: str = "Request timeout"):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+# Соответствие HTTP статусов классам исключений (один поиск в словаре вместо цепочки if/elif)
+_STATUS_MAP: Dict[int, Type[KaitenApiError]] = {
+    HTTPStatus.UNAUTHORIZED: KaitenAuthenticationError,
+    HTTPStatus.FORBIDDEN: KaitenPermissionError,
+    HTTPStatus.NOT_FOUND: KaitenNotFoundError,
+    HTTPStatus.UNPROCESSABLE_ENTITY: KaitenValidationError,
+    HTTPStatus.TOO_MANY_REQUESTS: KaitenRateLimitError,
+}
@@ -4,21 +4,258 @@
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING
+import contextlib
+import functools
+import random
+import sys
+import time
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable, Sequence, Tuple, Union
 import logging
 import aiohttp
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote, urlencode
+from yarl import URL
 
-from .config import KaitenConfig, KaitenCredentials
-from .exceptions import KaitenApiError, KaitenNotFoundError, KaitenValidationError
-from .models import Space, Board, Column, Lane, Card, Tag, Comment, Member, File, Property, Checklist, ChecklistItem
-
-if TYPE_CHECKING:
-    pass
+from .config import KaitenConfig, KaitenCredentials, KaitenRuntimeConfig
+from .exceptions import (
+    KaitenApiError, KaitenConnectionError, KaitenRateLimitError,
+    KaitenServerError, KaitenTimeoutError,
+)
+from .rate_limiter import TokenBucket, SlidingWindowLimiter
+from .cache import ETagCache, ResponseCache
+from .batch import RequestBatch, _gather_bounded
+from .models import LazyModelList, Space, Board, Column, Lane, Card, Tag, Comment, Member, File, Property, Checklist, ChecklistItem
 
 
 logger = logging.getLogger(__name__)
 
+# Заголовки запроса с JSON телом
+_JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+
+
+# Методы, повтор которых после ошибки сервера не создаёт дубликатов
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+# Имена фильтров get_cards, которые передаются в API как есть
+_GET_CARDS_PARAM_NAMES = (
+    'created_before', 'created_after', 'updated_before',
+    'updated_after', 'first_moved_in_progress_after', 'first_moved_in_progress_before',
+    'last_moved_to_done_at_after', 'last_moved_to_done_at_before', 'due_date_after',
+    'due_date_before', 'query', 'tag',
+    'tag_ids', 'type_ids', 'exclude_board_ids',
+    'exclude_lane_ids', 'exclude_column_ids', 'exclude_owner_ids',
+    'exclude_card_ids', 'column_ids', 'member_ids',
+    'owner_ids', 'responsible_ids', 'organizations_ids',
+    'states', 'external_id', 'additional_card_fields',
+    'search_fields', 'space_id', 'column_id',
+    'lane_id', 'condition', 'type_id',
+    'responsible_id', 'owner_id', 'archived',
+    'asap', 'overdue', 'done_on_time',
+    'with_due_date', 'is_request', 'limit',
+    'offset', 'order_space_id', 'order_by',
+    'order_direction',
+)
+
+
+if sys.version_info >= (3, 12):
+    def _start_task(coro) -> asyncio.Task:
+        """
+        Создаёт задачу, которая сразу выполняется до первого ожидания.
+        
+        Без планировщика задача ждёт следующей итерации цикла событий, прежде чем
+        начать отправку запроса; eager_start убирает эту задержку.
+        """
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+else:  # eager_start доступен с Python 3.12
+    _start_task = asyncio.ensure_future
+
+
+def _join(values) -> str:
+    """Список значений в строку через запятую."""
+    return ','.join(map(str, values))
+
+
+# Таблицы параметров: (имя аргумента, имя параметра в API, преобразование или None)
+_COMPANY_USERS_PARAMS = (
+    ('invites_only', 'invitesOnly', None),
+    ('with_transfer_access_status', 'withTransferAccessStatus', None),
+    ('for_members_section', 'for_members_section', None),
+    ('owner_only', 'owner_only', None),
+    ('only_paid', 'only_paid', None),
+    ('only_records_count', 'only_records_count', None),
+    ('only_virtual', 'only_virtual', None),
+    ('offset', 'offset', None),
+    ('limit', 'limit', None),
+    ('query', 'query', None),
+    ('access_type_permissions', 'access_type_permissions', None),
+    ('sd_access_type', 'sd_access_type', None),
+    ('take_licence', 'take_licence', None),
+    ('temporarily_inactive_status', 'temporarily_inactive_status', None),
+    ('group_ids', 'group_ids', _join),
+    ('permissions', 'permissions', _join),
+)
+
+_SELECT_VALUES_PARAMS = (
+    ('v2_select_search', 'v2_select_search', None),
+    ('query', 'query', None),
+    ('order_by', 'order_by', None),
+    ('ids', 'ids', _join),
+    ('conditions', 'conditions', _join),
+    ('offset', 'offset', None),
+    ('limit', 'limit', None),
+)
+
+# Таблицы необязательных полей тела запроса в том же формате
+_LANE_FIELDS = tuple((name, name, None) for name in (
+    'sort_order', 'row_count', 'wip_limit', 'default_card_type_id',
+    'wip_limit_type', 'external_id', 'default_tags',
+    'last_moved_warning_after_days', 'last_moved_warning_after_hours',
+    'last_moved_warning_after_minutes', 'condition',
+))
+
+_CARD_FIELDS = tuple((name, name, None) for name in (
+    'description', 'board_id', 'assignee_id', 'owner_id',
+    'priority', 'due_date', 'tags', 'parent_id',
+))
+
+_CUSTOM_PROPERTY_FIELDS = (
+    ('name', 'name', None),
+    ('property_type', 'type', None),
+    ('show_on_facade', 'show_on_facade', None),
+    ('multiline', 'multiline', None),
+    ('vote_variant', 'vote_variant', None),
+    ('values_type', 'values_type', None),
+    ('colorful', 'colorful', None),
+    ('multi_select', 'multi_select', None),
+    ('data', 'data', None),
+    ('formula', 'formula', None),
+    ('color', 'color', None),
+    ('fields_settings', 'fields_settings', None),
+)
+
+# Тип свойства после создания не меняется
+_CUSTOM_PROPERTY_UPDATE_FIELDS = tuple(row for row in _CUSTOM_PROPERTY_FIELDS if row[0] != 'property_type')
+
+_CHECKLIST_FIELDS = tuple((name, name, None) for name in (
+    'name', 'sort_order', 'items_source_checklist_id', 'exclude_item_ids', 'source_share_id',
+))
+
+_CHECKLIST_UPDATE_FIELDS = (
+    ('name', 'name', None),
+    ('sort_order', 'sort_order', None),
+    ('move_to_card_id', 'card_id', None),
+)
+
+_CHECKLIST_ITEM_UPDATE_FIELDS = (
+    ('text', 'text', None),
+    ('sort_order', 'sort_order', None),
+    ('checklist_id_new', 'checklist_id', None),
+    ('checked', 'checked', None),
+    ('due_date', 'due_date', None),
+    ('responsible_id', 'responsible_id', None),
+)
+
+_CHECKLIST_ITEM_FIELDS = tuple(row for row in _CHECKLIST_ITEM_UPDATE_FIELDS if row[0] != 'checklist_id_new')
+
+
+def _build_params(table, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Собирает параметры запроса (или тело) по таблице, пропуская аргументы со значением None."""
+    params = {}
+    for name, key, transform in table:
+        value = arguments[name]
+        if value is not None:
+            params[key] = transform(value) if transform is not None else value
+    return params
+
+
+def _items(response: Any) -> List[Dict[str, Any]]:
+    """Список элементов из ответа API: сам список или поле 'items' постраничного ответа."""
+    if type(response) is list:
+        return response
+    return response.get('items', [])
+
+
+def _check_paging(concurrency: int, page_size: int) -> None:
+    """Проверяет параметры постраничной загрузки: при нуле страниц цикл не продвигается."""
+    if concurrency < 1 or page_size < 1:
+        raise ValueError("concurrency и page_size должны быть положительными")
+
+
+def _resource_prefix(endpoint: str) -> str:
+    """Корневой ресурс эндпоинта: '/cards/1/comments' -> '/cards'."""
+    return '/' + endpoint.lstrip('/').split('/', 1)[0]
+
+
+def _encode_params(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Приводит параметры запроса к строкам один раз.
+    
+    Булевы значения передаются как 'true'/'false' (а не 'True'/'False'), None пропускается.
+    """
+    encoded = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if value is True:
+            encoded.append((key, 'true'))
+        elif value is False:
+            encoded.append((key, 'false'))
+        else:
+            encoded.append((key, str(value)))
+    return encoded
+
+
+# Символы, которые не экранируются в значениях строки запроса (как в yarl)
+_QUERY_SAFE = "/:@!$'()*,;"
+
+
+def _params_key(items) -> Tuple[Tuple[str, Any, type], ...]:
+    """
+    Ключ набора параметров для кэшей: тройки (имя, значение, тип значения).
+    
+    Тип входит в ключ, потому что True == 1 и False == 0 (и их хэши совпадают),
+    а в строку запроса они попадают по-разному: 'true' и '1'.
+    """
+    return tuple([(key, value, type(value)) for key, value in items])
+
+
+@functools.lru_cache(maxsize=512)
+def _query_string(items: Tuple[Tuple[str, Any, type], ...]) -> str:
+    """
+    Готовая (экранированная) строка запроса для набора параметров.
+    
+    Кэшируется: повторяющиеся наборы параметров (фильтры, страницы пагинации)
+    экранируются один раз.
+    
+    Args:
+        items: Ключ параметров из _params_key
+    """
+    params = {key: value for key, value, _ in items}
+    return urlencode(_encode_params(params), safe=_QUERY_SAFE, quote_via=quote)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Разбирает заголовок Retry-After (в секундах); None если он отсутствует или некорректен."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """
+    Следующая задержка перед повтором по схеме decorrelated jitter.
+    
+    Случайная задержка между base и утроенной предыдущей разводит по времени
+    повторы одновременно упавших запросов, чтобы они не сталкивались снова.
+    """
+    return min(cap, random.uniform(base, previous * 3))
+
 
 class KaitenClient:
     """
@@ -59,20 +296,51 @@ class KaitenClient:
     ```
     """
     
-    def __init__(self, token: str, domain: str = "api"):
+    def __init__(self, token: str, domain: str = "api",
+                 runtime_config: Optional[KaitenRuntimeConfig] = None):
         """
         Инициализация клиента.
         
         Args:
             token: API токен
             domain: Домен менеджера
+            runtime_config: Настройки повторов, таймаутов и лимита запросов
+                (по умолчанию значения из KaitenConfig)
         """
         self.token = token
         self.domain = domain
+        self.runtime_config = runtime_config or KaitenRuntimeConfig()
         self.session: Optional[aiohttp.ClientSession] = None
-        self._request_times: List[float] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if self.runtime_config.rate_limit_algo == "token_bucket":
+            self._rate_limiter = TokenBucket(
+                capacity=self.runtime_config.limit_per_sec,
+                rate=self.runtime_config.limit_per_sec
+            )
+        else:
+            self._rate_limiter = SlidingWindowLimiter(limit=self.runtime_config.limit_per_sec)
         self.config = KaitenCredentials(
             domain=domain, token=token)
+        self._cache: Optional[ResponseCache] = (
+            ResponseCache(KaitenConfig.CACHE_MAX_ENTRIES, KaitenConfig.CACHE_STALE_IF_ERROR)
+            if self.runtime_config.response_cache else None
+        )
+        # Выполняющиеся GET запросы: (эндпоинт, параметры) -> задача
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # Счётчики изменений по корневым ресурсам: ответ GET, начатого до изменения,
+        # не сохраняется в кэш
+        self._generations: Dict[str, int] = {}
+        self._etags: Optional[ETagCache] = (
+            ETagCache(KaitenConfig.ETAG_CACHE_SIZE) if self.runtime_config.conditional_get else None
+        )
+        # Ожидающие пакетной загрузки get_card: card_id -> future с карточкой
+        self._card_batch: Dict[int, asyncio.Future] = {}
+        self._card_batch_handle: Optional[asyncio.TimerHandle] = None
+        self._card_batch_tasks: set = set()
+        # Поддержка эндпоинта /cards/{id}/properties: базовый URL -> есть ли он
+        self._has_props_endpoint: Dict[str, bool] = {}
+        # Словарь {название кастомного свойства: ID} и момент, до которого он действителен
+        self._property_names: Optional[Tuple[float, Dict[str, int]]] = None
         self._is_initialized = False
 
         logger.info("Kaiten client initialized")
@@ -92,10 +360,28 @@ class KaitenClient:
         Вызывается автоматически при использовании async with или вручную.
         """
         if not self._is_initialized:
+            # Один пул соединений на весь клиент: TCP/TLS соединения
+            # переиспользуются между запросами вместо нового рукопожатия
+            connector = aiohttp.TCPConnector(
+                limit=KaitenConfig.POOL_CONNECTIONS,
+                limit_per_host=KaitenConfig.POOL_PER_HOST,
+                keepalive_timeout=KaitenConfig.KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=KaitenConfig.DNS_CACHE_TTL
+            )
             self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=KaitenConfig.DEFAULT_TIMEOUT),
-                headers=self.config.get_headers()
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.runtime_config.timeout,
+                    # Ожидание свободного соединения в пуле + установка соединения
+                    connect=KaitenConfig.POOL_ACQUIRE_TIMEOUT + KaitenConfig.CONNECT_TIMEOUT,
+                    sock_connect=KaitenConfig.CONNECT_TIMEOUT
+                ),
+                headers=self.config.session_headers
             )
+            # Ограничиваем число одновременных запросов заранее, чтобы лишние задачи
+            # ждали здесь, а не в очереди коннектора aiohttp (с таймаутом)
+            self._semaphore = asyncio.Semaphore(self.runtime_config.max_concurrency)
             self._is_initialized = True
             logger.info("Kaiten client session initialized")
     
@@ -105,13 +391,56 @@ class KaitenClient:
         Вызывается автоматически при выходе из async with или вручную.
         """
         if self.session and self._is_initialized:
+            for task in list(self._inflight.values()):
+                task.cancel()
+            self._inflight.clear()
+            if self._card_batch_handle is not None:
+                self._card_batch_handle.cancel()
+                self._card_batch_handle = None
+            for task in list(self._card_batch_tasks):
+                task.cancel()
+            for future in self._card_batch.values():
+                future.cancel()
+            self._card_batch.clear()
             await self.session.close()
             self.session = None
             self._is_initialized = False
             logger.info("Kaiten client session closed")
 
-    async def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
-        """Выполняет HTTP запрос к API с поддержкой повторов и лимитом запросов в секунду."""
+    def batch(self) -> RequestBatch:
+        """
+        Создаёт пакет запросов, выполняемых одновременно при выходе из блока.
+        
+        Пример:
+            async with client.batch() as batch:
+                boards = batch.add(client.get_boards(space_id))
+                lanes = batch.add(client.get_lanes(board_id))
+            boards.result()
+        """
+        return RequestBatch()
+
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                       cache: Optional[Tuple[float, float]] = None, conditional: bool = False,
+                       **kwargs) -> Any:
+        """
+        Выполняет HTTP запрос к API с поддержкой повторов и лимитом запросов в секунду.
+        
+        Одновременные одинаковые GET запросы объединяются в один.
+        
+        Args:
+            method: HTTP метод
+            endpoint: Эндпоинт относительно базового URL
+            params: Параметры строки запроса
+            cache: Политика кэширования GET запроса (ttl, stale) в секундах;
+                используется только если кэш включен в KaitenRuntimeConfig
+            conditional: Условный GET запрос: если сервер вернул ETag, при следующем
+                запросе отправляется If-None-Match, и на ответ 304 возвращается
+                сохранённое тело
+            **kwargs: Аргументы для aiohttp: json, data, headers (дополняют
+                заголовки сессии) и т.д. Вместо data можно передать data_factory -
+                функцию, создающую тело заново для каждой попытки (поток,
+                например файл, можно отправить только один раз)
+        """
         # Автоматически инициализируем клиент если он не инициализирован
         if not self._is_initialized:
             await self.initialize()
@@ -119,73 +448,253 @@ class KaitenClient:
         if not self.session:
             raise RuntimeError("Client session not available. Call initialize() first or use 'async with' context manager.")
 
-        # --- Лимит запросов в секунду ---
-        now = asyncio.get_event_loop().time()
-        # Удаляем устаревшие таймштампы
-        self._request_times = [t for t in self._request_times if now - t < 1.0]
-        
-        while len(self._request_times) >= KaitenConfig.LIMIT_PER_SEC:
-            oldest_request_time = min(self._request_times)
-            sleep_time = 1.0 - (now - oldest_request_time)
-            if sleep_time > 0:
-                logger.debug(f"Rate limit reached, sleeping for {sleep_time:.3f} seconds")
-                await asyncio.sleep(sleep_time)
+        if method != 'GET' or kwargs:
+            if method == 'GET':
+                return await self._send(method, endpoint, params, **kwargs)
+            # Любое изменение ресурса сбрасывает сохранённые ответы по нему
+            try:
+                return await self._send(method, endpoint, params, **kwargs)
+            finally:
+                self._invalidate(_resource_prefix(endpoint))
 
-            now = asyncio.get_event_loop().time()
-            self._request_times = [t for t in self._request_times if now - t < 1.0]
+        try:
+            key = (endpoint, _params_key(sorted(params.items())) if params else ())
+            hash(key)
+        except TypeError:
+            # Нехэшируемые значения параметров: запрос без объединения и кэша
+            return await self._send(method, endpoint, params)
 
-        self._request_times.append(now)
+        if cache is not None and self._cache is not None:
+            hit = self._cache.get(key)
+            if hit is not None:
+                value, fresh = hit
+                if not fresh:
+                    # Отдаём устаревшее значение сразу, а запись обновляем в фоне
+                    self._get_shared(key, endpoint, params, cache, conditional)
+                return value
 
-        url = KaitenConfig.get_base_url(self.domain) + endpoint
-        retries = KaitenConfig.MAX_RETRIES
-        delay = KaitenConfig.RETRY_DELAY
+        # shield: отмена одного ожидающего не должна отменять запрос для остальных
+        try:
+            return await asyncio.shield(self._get_shared(key, endpoint, params, cache, conditional))
+        except (KaitenServerError, KaitenConnectionError, KaitenTimeoutError):
+            if cache is None or self._cache is None:
+                raise
+            fallback = self._cache.get_on_error(key)
+            if fallback is None:
+                raise
+            logger.warning("GET %s failed, returning expired cached response", endpoint)
+            return fallback[0]
+
+    def _invalidate(self, prefix: str) -> None:
+        """
+        Сбрасывает всё, что могло запомнить состояние ресурса до изменения.
+        
+        Выполняющиеся GET запросы по ресурсу отсоединяются (их ждущие получат
+        свой результат), чтобы следующие GET не присоединялись к запросу,
+        начатому до изменения, а отправляли новый.
+        """
+        self._generations[prefix] = self._generations.get(prefix, 0) + 1
+        stale_keys = [key for key in self._inflight if key[0].startswith(prefix)]
+        for key in stale_keys:
+            del self._inflight[key]
+        if self._cache is not None:
+            self._cache.invalidate(prefix)
+        if self._etags is not None:
+            self._etags.invalidate(prefix)
+
+    def _get_shared(self, key: Tuple, endpoint: str, params: Optional[Dict[str, Any]],
+                    cache: Optional[Tuple[float, float]], conditional: bool = False) -> asyncio.Task:
+        """
+        Возвращает задачу GET запроса, общую для всех одновременных одинаковых запросов.
         
+        Пока запрос выполняется, повторные вызовы с тем же эндпоинтом и параметрами
+        ждут его результата вместо отправки нового запроса. Успешный ответ
+        сохраняется в кэш, если для запроса задана политика кэширования
+        и ресурс не изменялся, пока запрос выполнялся.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+
+        prefix = _resource_prefix(endpoint)
+        generation = self._generations.get(prefix, 0)
+
+        def on_done(task: asyncio.Task) -> None:
+            # Задача могла быть отсоединена изменением ресурса и заменена новой
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is not None:
+                # Ошибку получают ожидающие; здесь лишь помечаем её обработанной
+                # для фонового обновления кэша, которое никто не ждёт
+                logger.debug("GET %s failed: %s", endpoint, error)
+            elif (cache is not None and self._cache is not None
+                  and self._generations.get(prefix, 0) == generation):
+                self._cache.put(key, task.result(), *cache)
+
+        if conditional and self._etags is not None:
+            send = self._send('GET', endpoint, params, etag_key=key)
+        else:
+            send = self._send('GET', endpoint, params)
+        task = _start_task(send)
+        self._inflight[key] = task
+        task.add_done_callback(on_done)
+        return task
+
+    async def _send(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """Отправляет запрос с учетом лимита запросов и повторов, минуя кэш."""
+        url = self.config.base_url + endpoint
+        # Атрибуты, нужные на каждой попытке, читаем в локальные переменные один раз
+        runtime_config = self.runtime_config
+        session = self.session
+        semaphore = self._semaphore
+        retries = runtime_config.max_retries
+        base_delay = runtime_config.retry_delay
+        max_delay = runtime_config.retry_cap
+        delay = base_delay
+        retry_idempotent = method.upper() in _IDEMPOTENT_METHODS
+        
+        # Путь собран из констант и числовых ID, а строка запроса экранирована
+        # заранее, поэтому yarl не нужно заново разбирать и экранировать URL
         if params:
-            for key, value in params.items():
-                url += f"{'&' if '?' in url else '?'}{key}={value}"
+            try:
+                query = _query_string(_params_key(params.items()))
+            except TypeError:
+                # Нехэшируемые значения параметров: экранирует сам aiohttp (yarl)
+                kwargs['params'] = _encode_params(params)
+            else:
+                if query:
+                    url += '?' + query
+        url = URL(url, encoded=True)
 
-        for attempt in range(1, retries + 1):
+        # Тело кодируем сами, поэтому Content-Type указываем явно
+        payload = kwargs.pop('json', None)
+        if payload is not None:
+            kwargs['data'] = KaitenConfig.JSON_ENCODER(payload)
+            kwargs['headers'] = {**_JSON_HEADERS, **kwargs['headers']} if kwargs.get('headers') else _JSON_HEADERS
+
+        data_factory = kwargs.pop('data_factory', None)
+
+        read = self._read_response
+        etag_key = kwargs.pop('etag_key', None)
+        if etag_key is not None:
+            cached = self._etags.get(etag_key)
+            if cached is not None:
+                kwargs['headers'] = {'If-None-Match': cached[0]}
+            read = functools.partial(self._read_conditional, etag_key=etag_key, cached=cached)
+
+        # Быстрый режим: без лимита запросов и без повторов
+        if runtime_config.fast_mode:
+            if data_factory is not None:
+                kwargs['data'] = data_factory()
             try:
-                async with self.session.request(method, url, **kwargs) as response:
-                    if response.status == 429:
-                        # Специальная обработка для 429 ошибки
-                        retry_after = response.headers.get('Retry-After', '1')
-                        try:
-                            retry_delay = float(retry_after)
-                        except ValueError:
-                            retry_delay = 1.0
-                        
-                        logger.warning(f"Rate limit hit (429), waiting {retry_delay} seconds before retry {attempt}/{retries}")
-                        await asyncio.sleep(retry_delay)
-                        
-                        # Очищаем историю запросов после получения 429
-                        self._request_times = []
-                        
-                        if attempt < retries:
-                            continue
-                        else:
-                            raise KaitenApiError(f"Rate limit exceeded after {retries} retries")
-                    
-                    elif response.status == 404:
-                        raise KaitenNotFoundError(f"Resource not found: {endpoint}")
-                    elif response.status == 422:
-                        error_data = await response.json()
-                        raise KaitenValidationError(f"Validation error: {error_data}")
-                    elif response.status >= 400:
-                        error_data = await response.text()
-                        raise KaitenApiError(f"API error {response.status}: {error_data}")
-
-                    if response.status == 204:  # No Content
-                        return None
-
-                    return await response.json()
+                async with semaphore:
+                    async with session.request(method, url, **kwargs) as response:
+                        return await read(response, endpoint)
+            except asyncio.TimeoutError as e:
+                raise KaitenTimeoutError(f"Request timeout: {endpoint}") from e
+            except aiohttp.ClientError as e:
+                raise KaitenConnectionError(f"HTTP client error: {e}") from e
 
+        for attempt in range(1, retries + 1):
+            # Лимит запросов в секунду: место в лимите занимает каждая попытка,
+            # в том числе повтор после 429
+            await self._rate_limiter.acquire()
+            retry_after = None
+            if data_factory is not None:
+                kwargs['data'] = data_factory()
+            try:
+                async with semaphore:
+                    async with session.request(method, url, **kwargs) as response:
+                        if response.status != 429:
+                            return await read(response, endpoint)
+                        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                error = KaitenRateLimitError("Rate limit hit (429)", retry_after=retry_after)
+            except asyncio.TimeoutError as e:
+                # Общий таймаут сессии (и ServerTimeoutError aiohttp). Запрос мог дойти
+                # до сервера, поэтому повторяем его только там, где повтор безопасен
+                error = KaitenTimeoutError(f"Request timeout: {endpoint}")
+                error.__cause__ = e
+                if not retry_idempotent:
+                    raise error
             except aiohttp.ClientError as e:
-                if attempt < retries:
-                    logger.warning(f"HTTP client error: {e}. Retrying {attempt}/{retries} after {delay} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    raise KaitenApiError(f"HTTP client error after {retries} retries: {e}")
+                error = KaitenConnectionError(f"HTTP client error: {e}")
+                error.__cause__ = e
+            except KaitenApiError as e:
+                # Ошибку сервера повторяем только там, где повтор не создаст дубликат
+                if not retry_idempotent:
+                    raise
+                error = e
+
+            if not error.RETRYABLE:
+                raise error
+            if attempt == retries:
+                error.args = (f"{error.message} after {retries} retries",)
+                raise error
+
+            # Не просыпаемся раньше, чем разрешил сервер
+            delay = _decorrelated_jitter(delay, base_delay, max_delay)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+            logger.warning("%s. Retrying %d/%d after %.2f seconds...", error.message, attempt, retries, delay)
+            await asyncio.sleep(delay)
+
+            if error.status_code == 429:
+                # Сервер просит притормозить - не выпускаем накопленный всплеск
+                self._rate_limiter.drain()
+
+    async def _read_conditional(self, response: aiohttp.ClientResponse, endpoint: str,
+                                etag_key: Tuple, cached: Optional[Tuple[str, Any]]) -> Any:
+        """
+        Разбирает ответ условного GET запроса и запоминает тело вместе с ETag.
+        
+        Хранится сырое тело ответа, а на 304 оно разбирается заново: каждый вызов
+        получает собственный объект, и изменения результата вызывающим кодом
+        не попадают в последующие ответы.
+        """
+        if response.status == 304 and cached is not None:
+            body = cached[1]
+            return KaitenConfig.JSON_DECODER(body) if body.strip() else None
+
+        data = await self._read_response(response, endpoint)
+        etag = response.headers.get('ETag')
+        if etag is not None:
+            # Тело уже прочитано _read_response, повторный read() отдаёт его без сети
+            self._etags.put(etag_key, etag, await response.read())
+        return data
+
+    @staticmethod
+    async def _read_response(response: aiohttp.ClientResponse, endpoint: str) -> Any:
+        """Разбирает ответ API: возвращает JSON или выбрасывает исключение по статусу."""
+        if response.status >= 400:
+            if response.status == 422:
+                error_data = await response.read()
+                try:
+                    error_data = KaitenConfig.JSON_DECODER(error_data)
+                except ValueError:
+                    # Не JSON (например, HTML страница прокси): from_response возьмёт текст
+                    pass
+            else:
+                error_data = await response.text()
+            raise KaitenApiError.from_response(response.status, error_data, endpoint)
+
+        if response.status == 204:  # No Content
+            return None
+
+        # Разбираем сырые байты сами: без декодирования в str и проверок aiohttp
+        body = await response.read()
+        if not body.strip():
+            return None
+        try:
+            return KaitenConfig.JSON_DECODER(body)
+        except ValueError as e:
+            raise KaitenApiError(
+                f"Invalid JSON in response from {endpoint}: {body[:200].decode('utf-8', errors='replace')}",
+                status_code=response.status,
+            ) from e
 
     # === КАРТОЧКИ ===
 
@@ -248,7 +757,8 @@ class KaitenClient:
                         order_direction: Optional[str] = None,  # 'asc' или 'desc'
                         # Продвинутые фильтры
                         filter_: Optional[str] = None,  # base64 encoded filter
-                        **extra_filters) -> List[Card]:
+                        raw: bool = False,
+                        **extra_filters) -> Union[List[Card], List[Dict[str, Any]]]:
         """
         Получает список карточек с расширенной фильтрацией.
         
@@ -311,10 +821,12 @@ class KaitenClient:
             order_direction: Направление сортировки 'asc' или 'desc' (через запятую)
             # Продвинутые фильтры
             filter_: Фильтр по условиям и/или в формате base64
+            raw: Вернуть данные карточек из API (словари) без создания объектов Card -
+                для подсчёта, фильтрации и выборки ID; словари не следует изменять
             **extra_filters: Дополнительные фильтры
         
         Returns:
-            Список карточек
+            Список карточек (или их данных при raw=True)
         """
         # Формируем параметры запроса
         params = {}
@@ -323,66 +835,76 @@ class KaitenClient:
         if board_id:
             params['board_id'] = board_id
         
-        # Добавляем все остальные параметры если они не None
-        all_params = {
-            'created_before': created_before,
-            'created_after': created_after,
-            'updated_before': updated_before,
-            'updated_after': updated_after,
-            'first_moved_in_progress_after': first_moved_in_progress_after,
-            'first_moved_in_progress_before': first_moved_in_progress_before,
-            'last_moved_to_done_at_after': last_moved_to_done_at_after,
-            'last_moved_to_done_at_before': last_moved_to_done_at_before,
-            'due_date_after': due_date_after,
-            'due_date_before': due_date_before,
-            'query': query,
-            'tag': tag,
-            'tag_ids': tag_ids,
-            'type_ids': type_ids,
-            'exclude_board_ids': exclude_board_ids,
-            'exclude_lane_ids': exclude_lane_ids,
-            'exclude_column_ids': exclude_column_ids,
-            'exclude_owner_ids': exclude_owner_ids,
-            'exclude_card_ids': exclude_card_ids,
-            'column_ids': column_ids,
-            'member_ids': member_ids,
-            'owner_ids': owner_ids,
-            'responsible_ids': responsible_ids,
-            'organizations_ids': organizations_ids,
-            'states': states,
-            'external_id': external_id,
-            'additional_card_fields': additional_card_fields,
-            'search_fields': search_fields,
-            'space_id': space_id,
-            'column_id': column_id,
-            'lane_id': lane_id,
-            'condition': condition,
-            'type_id': type_id,
-            'responsible_id': responsible_id,
-            'owner_id': owner_id,
-            'archived': archived,
-            'asap': asap,
-            'overdue': overdue,
-            'done_on_time': done_on_time,
-            'with_due_date': with_due_date,
-            'is_request': is_request,
-            'limit': limit,
-            'offset': offset,
-            'order_space_id': order_space_id,
-            'order_by': order_by,
-            'order_direction': order_direction,
-            'filter': filter_,
-            **extra_filters
-        }
-        
         # Добавляем только не-None параметры
-        for key, value in all_params.items():
+        local_vars = locals()
+        for name in _GET_CARDS_PARAM_NAMES:
+            value = local_vars[name]
+            if value is not None:
+                params[name] = value
+        if filter_ is not None:
+            params['filter'] = filter_
+        for key, value in extra_filters.items():
             if value is not None:
                 params[key] = value
 
-        response = await self._request('GET', KaitenConfig.ENDPOINT_CARDS, params=params)
-        cards_data = response if isinstance(response, list) else response.get('items', [])
-        return [Card(self, card_data) for card_data in cards_data]
+        response = await self._request('GET', KaitenConfig.ENDPOINT_CARDS, params=params,
+                                       cache=KaitenConfig.CACHE_VOLATILE)
+        cards_data = _items(response)
+        if raw:
+            return cards_data
+        return Card.from_list(self, cards_data)
+    
+    async def get_all_cards(self, board_id: Optional[int] = None,
+                            concurrency: int = KaitenConfig.PAGE_CONCURRENCY, **filters) -> List[Card]:
+        """
+        Получает все карточки, подходящие под фильтры, со всех страниц.
+        
+        Args:
+            board_id: ID доски
+            concurrency: Сколько страниц запрашивать одновременно
+            **filters: Фильтры get_cards, включая raw (limit и offset задаются автоматически)
+        
+        Returns:
+            Список карточек
+        """
+        _check_paging(concurrency, KaitenConfig.CARDS_PAGE_SIZE)
+        return [card async for card in self.iter_cards(board_id, concurrency, **filters)]
+    
+    async def iter_cards(self, board_id: Optional[int] = None,
+                         concurrency: int = KaitenConfig.PAGE_CONCURRENCY, **filters) -> AsyncIterator[Card]:
+        """
+        Перебирает все карточки, подходящие под фильтры, по мере загрузки страниц.
+        
+        API отдаёт не больше CARDS_PAGE_SIZE карточек за запрос и не сообщает их общее
+        количество, поэтому страницы запрашиваются параллельно по `concurrency` штук,
+        пока не придёт неполная страница. Следующие страницы запрашиваются, только когда
+        вызывающий код перебрал уже загруженные, поэтому в памяти не больше `concurrency` страниц.
+        
+        Пример:
+            async for card in client.iter_cards(board_id=1):
+                print(card.title)
+        
+        Args:
+            board_id: ID доски
+            concurrency: Сколько страниц запрашивать одновременно
+            **filters: Фильтры get_cards, включая raw (limit и offset задаются автоматически)
+        """
+        page_size = KaitenConfig.CARDS_PAGE_SIZE
+        _check_paging(concurrency, page_size)
+        filters.pop('limit', None)
+        filters.pop('offset', None)
+        offset = 0
+        while True:
+            pages = await asyncio.gather(*(
+                self.get_cards(board_id=board_id, limit=page_size, offset=offset + index * page_size, **filters)
+                for index in range(concurrency)
+            ))
+            for page in pages:
+                for card in page:
+                    yield card
+                if len(page) < page_size:
+                    return
+            offset += concurrency * page_size
     
     async def get_card(self, card_id: int, additional_fields: Optional[str] = None) -> Card:
         """
@@ -395,13 +917,109 @@ class KaitenClient:
         Returns:
             Объект карточки
         """
+        if self.runtime_config.batch_get_card and not additional_fields:
+            return await self._get_card_batched(card_id)
+
         params = {}
         if additional_fields:
             params['additional_card_fields'] = additional_fields
         
-        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}', params=params)
+        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}', params=params,
+                                   cache=KaitenConfig.CACHE_VOLATILE)
         return Card(self, data)
 
+    async def get_card_extras(self, card_id: int, fields: Iterable[str]) -> Dict[str, Any]:
+        """
+        Получает дополнительные разделы карточки одним запросом.
+        
+        Например, чек-листы и значения кастомных свойств вместо двух запросов
+        к карточке загружаются одним с additional_card_fields='checklists,properties'.
+        
+        Args:
+            card_id: ID карточки
+            fields: Названия разделов (например, ('checklists', 'properties'))
+        
+        Returns:
+            Словарь {раздел: данные}; для отсутствующего в ответе раздела
+            'properties' возвращается {}, для остальных []
+        """
+        fields = tuple(fields)
+        params = {'additional_card_fields': ','.join(fields)}
+        card_data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}', params=params,
+                                        cache=KaitenConfig.CACHE_VOLATILE)
+        return {
+            field: card_data.get(field, {} if field == 'properties' else [])
+            for field in fields
+        }
+
+    async def _get_card_batched(self, card_id: int) -> Card:
+        """Ставит карточку в очередь пакетной загрузки и ждёт результат."""
+        future = self._card_batch.get(card_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._card_batch[card_id] = future
+            if len(self._card_batch) >= KaitenConfig.CARD_BATCH_MAX:
+                self._start_card_batch()
+            elif self._card_batch_handle is None:
+                self._card_batch_handle = loop.call_later(
+                    KaitenConfig.CARD_BATCH_WINDOW, self._start_card_batch
+                )
+        # shield: отмена одного ожидающего не должна отменять загрузку для остальных
+        return await asyncio.shield(future)
+
+    def _start_card_batch(self) -> None:
+        """Забирает накопленные запросы get_card и запускает их загрузку одним запросом."""
+        if self._card_batch_handle is not None:
+            self._card_batch_handle.cancel()
+            self._card_batch_handle = None
+        batch, self._card_batch = self._card_batch, {}
+        if not batch:
+            return
+        task = _start_task(self._flush_card_batch(batch))
+        self._card_batch_tasks.add(task)
+        task.add_done_callback(self._card_batch_tasks.discard)
+
+    async def _flush_card_batch(self, batch: Dict[int, asyncio.Future]) -> None:
+        """Загружает пакет карточек через get_cards и раздаёт результат ожидающим."""
+        if len(batch) == 1:
+            # Одиночный запрос выгоднее отправить как обычный get_card
+            missing = batch
+        else:
+            try:
+                cards = await self.get_cards(
+                    card_ids=','.join(map(str, batch)), limit=len(batch)
+                )
+            except Exception as e:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            found = {card.id: card for card in cards}
+            missing = {}
+            for card_id, future in batch.items():
+                card = found.get(card_id)
+                if card is None:
+                    missing[card_id] = future
+                elif not future.done():
+                    future.set_result(card)
+
+        # Карточки, не попавшие в ответ (например, архивные), и одиночные
+        # запросы загружаем по одной - ошибки (в т.ч. 404) достаются своему ожидающему
+        async def fetch_single(card_id: int, future: asyncio.Future) -> None:
+            try:
+                data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}',
+                                           cache=KaitenConfig.CACHE_VOLATILE)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(Card(self, data))
+
+        await asyncio.gather(*(fetch_single(card_id, future) for card_id, future in missing.items()))
+
     async def create_card(
         self,
         title: str,
@@ -442,18 +1060,7 @@ class KaitenClient:
         }
         
         # Добавляем опциональные поля
-        for field, value in {
-            'description': description,
-            'board_id': board_id,
-            'assignee_id': assignee_id,
-            'owner_id': owner_id,
-            'priority': priority,
-            'due_date': due_date,
-            'tags': tags,
-            'parent_id': parent_id
-        }.items():
-            if value is not None:
-                data[field] = value
+        data.update(_build_params(_CARD_FIELDS, locals()))
         
         card_data = await self._request('POST', KaitenConfig.ENDPOINT_CARDS, json=data)
         return Card(self, card_data)
@@ -480,20 +1087,63 @@ class KaitenClient:
         """Перемещает карточку в другую колонку."""
         data = await self.update_card(card_id, column_id=column_id)
         return Card(self, data)
+
+    async def get_card_bundle(self, card_id: int,
+                              additional_fields: Optional[str] = None
+                              ) -> Tuple[Card, List[Comment], List[Member], List[File]]:
+        """
+        Получает карточку вместе с комментариями, участниками и файлами.
+        
+        Запросы независимы и выполняются одновременно, поэтому общее время
+        близко к времени самого долгого из них, а не к их сумме.
+        
+        Args:
+            card_id: ID карточки
+            additional_fields: Дополнительные поля карточки (например, 'description,checklists')
+        
+        Returns:
+            Кортеж (карточка, комментарии, участники, файлы)
+        """
+        card, comments, members, files = await asyncio.gather(
+            self.get_card(card_id, additional_fields),
+            self.get_card_comments(card_id),
+            self.get_card_members(card_id),
+            self.get_card_files(card_id),
+        )
+        return card, comments, members, files
     
     # === КОММЕНТАРИИ ===
     
     async def get_card_comments(self, card_id: int) -> List[Comment]:
         """Получает комментарии карточки."""
-        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS.format(card_id=card_id)
-        response = await self._request('GET', endpoint)
-        comments_data = response if isinstance(response, list) else response.get('items', [])
-        return [Comment(self, comment_data) for comment_data in comments_data]
+        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS_FMT(card_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_VOLATILE, conditional=True)
+        comments_data = _items(response)
+        return Comment.from_list(self, comments_data)
+    
+    async def get_card_comment(self, card_id: int, comment_id: int) -> Optional[Comment]:
+        """
+        Получает комментарий карточки по ID.
+        
+        Отдельного эндпоинта нет, поэтому загружается список комментариев карточки.
+        Одновременные вызовы для одной карточки (например, refresh нескольких
+        объектов через asyncio.gather) объединяются в один запрос, а при включенном
+        кэше ответов повторные вызовы обходятся без запроса.
+        
+        Returns:
+            Объект комментария или None, если он не найден
+        """
+        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS_FMT(card_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_VOLATILE, conditional=True)
+        for row in _items(response):
+            if row.get('id') == comment_id:
+                return Comment(self, row)
+        return None
     
     async def add_comment(self, card_id: int, text: str) -> Comment:
         """Добавляет комментарий к карточке."""
         data = {'text': text}
-        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS_FMT(card_id)
         comment_data = await self._request('POST', endpoint, json=data)
         return Comment(self, comment_data)
     
@@ -501,13 +1151,13 @@ class KaitenClient:
                              comment_id: int, text: str) -> Dict[str, Any]:
         """Обновляет комментарий."""
         data = {'text': text}
-        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS_FMT(card_id)
         return await self._request('PATCH', f'{endpoint}/{comment_id}', json=data)
 
     async def delete_comment(self, card_id: int, 
                              comment_id: int) -> bool:
         """Удаляет комментарий."""
-        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_COMMENTS_FMT(card_id)
         await self._request('DELETE', f'{endpoint}/{comment_id}')
         return True
     
@@ -515,21 +1165,21 @@ class KaitenClient:
     
     async def get_card_members(self, card_id: int) -> List[Member]:
         """Получает участников карточки."""
-        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS.format(card_id=card_id)
-        response = await self._request('GET', endpoint)
-        members_data = response if isinstance(response, list) else response.get('items', [])
-        return [Member(self, member_data) for member_data in members_data]
+        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS_FMT(card_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_VOLATILE)
+        members_data = _items(response)
+        return Member.from_list(self, members_data)
     
     async def add_card_member(self, card_id: int, user_id: int) -> Member:
         """Добавляет участника к карточке."""
         data = {'user_id': user_id}
-        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS_FMT(card_id)
         member_data = await self._request('POST', endpoint, json=data)
         return Member(self, member_data)
     
     async def remove_card_member(self, card_id: int, user_id: int) -> bool:
         """Удаляет участника из карточки."""
-        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_MEMBERS_FMT(card_id)
         await self._request('DELETE', f'{endpoint}/{user_id}')
         return True
     
@@ -537,10 +1187,29 @@ class KaitenClient:
     
     async def get_card_files(self, card_id: int) -> List[File]:
         """Получает файлы карточки."""
-        endpoint = KaitenConfig.ENDPOINT_CARD_FILES.format(card_id=card_id)
-        response = await self._request('GET', endpoint)
-        files_data = response if isinstance(response, list) else response.get('items', [])
-        return [File(self, file_data) for file_data in files_data]
+        endpoint = KaitenConfig.ENDPOINT_CARD_FILES_FMT(card_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_VOLATILE, conditional=True)
+        files_data = _items(response)
+        return File.from_list(self, files_data)
+    
+    async def get_card_file(self, card_id: int, file_id: int) -> Optional[File]:
+        """
+        Получает файл карточки по ID.
+        
+        Отдельного эндпоинта нет, поэтому загружается список файлов карточки.
+        Одновременные вызовы для одной карточки (например, refresh нескольких
+        объектов через asyncio.gather) объединяются в один запрос, а при включенном
+        кэше ответов повторные вызовы обходятся без запроса.
+        
+        Returns:
+            Объект файла или None, если он не найден
+        """
+        endpoint = KaitenConfig.ENDPOINT_CARD_FILES_FMT(card_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_VOLATILE, conditional=True)
+        for row in _items(response):
+            if row.get('id') == file_id:
+                return File(self, row)
+        return None
     
     async def upload_file(self, card_id: int, file_path: str, file_name: Optional[str] = None) -> File:
         """
@@ -554,35 +1223,34 @@ class KaitenClient:
         Returns:
             Информация о загруженном файле
         """
-        import aiofiles
-        from pathlib import Path
-        
         if not file_name:
             file_name = Path(file_path).name
         
-        async with aiofiles.open(file_path, 'rb') as f:
-            file_data = await f.read()
-        
-        # Для загрузки файлов используем multipart/form-data
-        data = aiohttp.FormData()
-        data.add_field('file', file_data, filename=file_name)
-        data.add_field('card_id', str(card_id))
-        
-        # Временно меняем заголовки для загрузки файлов
-        headers = self.config.get_upload_headers()
-        url = f"{KaitenConfig.get_base_url(self.domain)}/{KaitenConfig.ENDPOINT_CARD_FILES.format(card_id=card_id)}"
-        
-        async with self.session.post(url, data=data, headers=headers) as response:
-            if response.status >= 400:
-                error_data = await response.text()
-                raise KaitenApiError(f"File upload error {response.status}: {error_data}")
-            result_data = await response.json()
-            return File(self, result_data)
+        with contextlib.ExitStack() as opened_files:
+            def build_form() -> aiohttp.FormData:
+                # Файл не читается в память целиком: aiohttp отправляет его частями,
+                # читая в пуле потоков, а размер берёт из fstat для Content-Length.
+                # После отправки aiohttp закрывает файл, поэтому для повтора
+                # форма собирается заново
+                f = opened_files.enter_context(open(file_path, 'rb'))
+                # Для загрузки файлов используем multipart/form-data
+                data = aiohttp.FormData()
+                data.add_field('file', f, filename=file_name,
+                               content_type='application/octet-stream')
+                data.add_field('card_id', str(card_id))
+                return data
+            
+            # Загрузка идёт через общий _request: лимит запросов, повторы и Retry-After
+            result_data = await self._request(
+                'POST', KaitenConfig.ENDPOINT_CARD_FILES_FMT(card_id),
+                data_factory=build_form, headers=self.config.upload_headers
+            )
+        return File(self, result_data)
 
     async def delete_file(self, card_id: int,
                           file_id: int) -> bool:
         """Удаляет файл."""
-        endpoint = KaitenConfig.ENDPOINT_FILES.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_FILES
         await self._request('DELETE', f'{endpoint}/{file_id}')
         return True
     
@@ -590,13 +1258,13 @@ class KaitenClient:
     
     async def get_tags(self) -> List[Tag]:
         """Получает список тегов в пространстве."""
-        response = await self._request('GET', KaitenConfig.ENDPOINT_TAGS)
-        tags_data = response if isinstance(response, list) else response.get('items', [])
-        return [Tag(self, tag_data) for tag_data in tags_data]
+        response = await self._request('GET', KaitenConfig.ENDPOINT_TAGS, cache=KaitenConfig.CACHE_LIST)
+        tags_data = _items(response)
+        return Tag.from_list(self, tags_data)
     
     async def get_tag(self, tag_id: int) -> Tag:
         """Получает тег по ID."""
-        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_TAGS}/{tag_id}')
+        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_TAGS}/{tag_id}', cache=KaitenConfig.CACHE_ENTITY)
         return Tag(self, data)
     
     async def create_tag(
@@ -647,13 +1315,13 @@ class KaitenClient:
     
     async def get_spaces(self) -> List[Space]:
         """Получает список пространств."""
-        response = await self._request('GET', KaitenConfig.ENDPOINT_SPACES)
-        spaces_data = response if isinstance(response, list) else response.get('items', [])
-        return [Space(self, space_data) for space_data in spaces_data]
+        response = await self._request('GET', KaitenConfig.ENDPOINT_SPACES, cache=KaitenConfig.CACHE_LIST)
+        spaces_data = _items(response)
+        return Space.from_list(self, spaces_data)
     
     async def get_space(self, space_id: int) -> Space:
         """Получает пространство по ID."""
-        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_SPACES}/{space_id}')
+        data = await self._request('GET', f'{KaitenConfig.ENDPOINT_SPACES}/{space_id}', cache=KaitenConfig.CACHE_ENTITY)
         return Space(self, data)
     
     async def create_space(
@@ -715,7 +1383,7 @@ class KaitenClient:
         
         endpoint = f'{KaitenConfig.ENDPOINT_SPACES}/{space_id}/users'
         response = await self._request('GET', endpoint, params=params)
-        return response if isinstance(response, list) else response.get('items', [])
+        return _items(response)
     
     # === ПОЛЬЗОВАТЕЛИ КОМПАНИИ ===
     
@@ -763,57 +1431,24 @@ class KaitenClient:
         Returns:
             Список пользователей компании
         """
-        params = {}
-        
-        if invites_only is not None:
-            params['invitesOnly'] = invites_only
-        if with_transfer_access_status is not None:
-            params['withTransferAccessStatus'] = with_transfer_access_status
-        if for_members_section is not None:
-            params['for_members_section'] = for_members_section
-        if owner_only is not None:
-            params['owner_only'] = owner_only
-        if only_paid is not None:
-            params['only_paid'] = only_paid
-        if only_records_count is not None:
-            params['only_records_count'] = only_records_count
-        if only_virtual is not None:
-            params['only_virtual'] = only_virtual
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if query is not None:
-            params['query'] = query
-        if access_type_permissions is not None:
-            params['access_type_permissions'] = access_type_permissions
-        if sd_access_type is not None:
-            params['sd_access_type'] = sd_access_type
-        if take_licence is not None:
-            params['take_licence'] = take_licence
-        if temporarily_inactive_status is not None:
-            params['temporarily_inactive_status'] = temporarily_inactive_status
-        if group_ids is not None:
-            params['group_ids'] = ','.join(map(str, group_ids))
-        if permissions is not None:
-            params['permissions'] = ','.join(permissions)
+        params = _build_params(_COMPANY_USERS_PARAMS, locals())
         
         endpoint = '/company/users'
         response = await self._request('GET', endpoint, params=params)
-        return response if isinstance(response, list) else response.get('items', [])
+        return _items(response)
     
     # === ДОСКИ ===
     
-    async def get_boards(self, space_id: int) -> List[Board]:
+    async def get_boards(self, space_id: int) -> Sequence[Board]:
         """Получает список досок в пространстве."""
-        endpoint = KaitenConfig.ENDPOINT_BOARDS.format(space_id=space_id)
-        response = await self._request('GET', endpoint)
-        boards_data = response if isinstance(response, list) else response.get('items', [])
-        return [Board(self, board_data) for board_data in boards_data]
+        endpoint = KaitenConfig.ENDPOINT_BOARDS_FMT(space_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_LIST)
+        boards_data = _items(response)
+        return LazyModelList(self, boards_data, Board)
     
     async def get_board(self, board_id: int) -> Board:
         """Получает доску по ID."""
-        data = await self._request('GET', f'/boards/{board_id}')
+        data = await self._request('GET', f'/boards/{board_id}', conditional=True)
         return Board(self, data)
     
     async def create_board(
@@ -845,39 +1480,39 @@ class KaitenClient:
         if description:
             data['description'] = description
         
-        endpoint = KaitenConfig.ENDPOINT_BOARDS.format(space_id=space_id)
+        endpoint = KaitenConfig.ENDPOINT_BOARDS_FMT(space_id)
         board_data = await self._request('POST', endpoint, json=data)
         return Board(self, board_data)
     
     async def update_board(self, space_id: int, 
                            board_id: int, **fields) -> Dict[str, Any]:
         """Обновляет доску."""
-        endpoint = KaitenConfig.ENDPOINT_BOARDS.format(space_id=space_id)
+        endpoint = KaitenConfig.ENDPOINT_BOARDS_FMT(space_id)
         return await self._request('PATCH', f'{endpoint}/{board_id}', json=fields)
     
     async def delete_board(self, space_id: int, 
                            board_id: int) -> bool:
         """Удаляет доску."""
-        endpoint = KaitenConfig.ENDPOINT_BOARDS.format(space_id=space_id)
+        endpoint = KaitenConfig.ENDPOINT_BOARDS_FMT(space_id)
         await self._request('DELETE', f'{endpoint}/{board_id}')
         return True
     
     # === КОЛОНКИ ===
     
-    async def get_columns(self, board_id: int) -> List[Column]:
+    async def get_columns(self, board_id: int) -> Sequence[Column]:
         """Получает колонки доски."""
-        endpoint = KaitenConfig.ENDPOINT_COLUMNS.format(board_id=board_id)
-        response = await self._request('GET', endpoint)
-        columns_data = response if isinstance(response, list) else response.get('items', [])
-        return [Column(self, column_data) for column_data in columns_data]
+        endpoint = KaitenConfig.ENDPOINT_COLUMNS_FMT(board_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_LIST)
+        columns_data = _items(response)
+        return LazyModelList(self, columns_data, Column)
     
     async def get_column(self, board_id: int, 
                          column_id: int) -> Column:
         """Получает колонку по ID.
            МОЖЕТ НЕ РАБОТАТЬ!
         """
-        endpoint = KaitenConfig.ENDPOINT_COLUMNS.format(board_id=board_id)
-        data = await self._request('GET', f'{endpoint}/{column_id}')
+        endpoint = KaitenConfig.ENDPOINT_COLUMNS_FMT(board_id)
+        data = await self._request('GET', f'{endpoint}/{column_id}', conditional=True)
         return Column(self, data)
     
     async def create_column(
@@ -901,26 +1536,26 @@ class KaitenClient:
         if position is not None:
             data['position'] = position
         
-        endpoint = KaitenConfig.ENDPOINT_COLUMNS.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_COLUMNS_FMT(board_id)
         column_data = await self._request('POST', endpoint, json=data)
         return Column(self, column_data)
     
     async def update_column(self, board_id: int, 
                             column_id: int, **fields) -> Dict[str, Any]:
         """Обновляет колонку."""
-        endpoint = KaitenConfig.ENDPOINT_COLUMNS.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_COLUMNS_FMT(board_id)
         return await self._request('PATCH', f'{endpoint}/{column_id}', json=fields)
     
     async def delete_column(self, board_id: int,
                             column_id: int) -> bool:
         """Удаляет колонку."""
-        endpoint = KaitenConfig.ENDPOINT_COLUMNS.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_COLUMNS_FMT(board_id)
         await self._request('DELETE', f'{endpoint}/{column_id}')
         return True
     
     # === ДОРОЖКИ ===
     
-    async def get_lanes(self, board_id: int) -> List[Lane]:
+    async def get_lanes(self, board_id: int) -> Sequence[Lane]:
         """
         Получает список дорожек доски.
         
@@ -930,10 +1565,10 @@ class KaitenClient:
         Returns:
             Список дорожек
         """
-        endpoint = KaitenConfig.ENDPOINT_LANES.format(board_id=board_id)
-        response = await self._request('GET', endpoint)
-        lanes_data = response if isinstance(response, list) else response.get('items', [])
-        return [Lane(self, lane_data) for lane_data in lanes_data]
+        endpoint = KaitenConfig.ENDPOINT_LANES_FMT(board_id)
+        response = await self._request('GET', endpoint, cache=KaitenConfig.CACHE_LIST)
+        lanes_data = _items(response)
+        return LazyModelList(self, lanes_data, Lane)
     
     async def get_lane(self, board_id: int, lane_id: int) -> Lane:
         """
@@ -946,8 +1581,8 @@ class KaitenClient:
         Returns:
             Дорожка
         """
-        endpoint = KaitenConfig.ENDPOINT_LANES.format(board_id=board_id)
-        data = await self._request('GET', f'{endpoint}/{lane_id}')
+        endpoint = KaitenConfig.ENDPOINT_LANES_FMT(board_id)
+        data = await self._request('GET', f'{endpoint}/{lane_id}', conditional=True)
         return Lane(self, data)
     
     async def create_lane(
@@ -995,23 +1630,9 @@ class KaitenClient:
         }
         
         # Добавляем опциональные поля
-        for field, value in {
-            'sort_order': sort_order,
-            'row_count': row_count,
-            'wip_limit': wip_limit,
-            'default_card_type_id': default_card_type_id,
-            'wip_limit_type': wip_limit_type,
-            'external_id': external_id,
-            'default_tags': default_tags,
-            'last_moved_warning_after_days': last_moved_warning_after_days,
-            'last_moved_warning_after_hours': last_moved_warning_after_hours,
-            'last_moved_warning_after_minutes': last_moved_warning_after_minutes,
-            'condition': condition
-        }.items():
-            if value is not None:
-                data[field] = value
+        data.update(_build_params(_LANE_FIELDS, locals()))
         
-        endpoint = KaitenConfig.ENDPOINT_LANES.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_LANES_FMT(board_id)
         lane_data = await self._request('POST', endpoint, json=data)
         return Lane(self, lane_data)
     
@@ -1028,7 +1649,7 @@ class KaitenClient:
         Returns:
             Обновленная дорожка
         """
-        endpoint = KaitenConfig.ENDPOINT_LANES.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_LANES_FMT(board_id)
         return await self._request('PATCH', f'{endpoint}/{lane_id}', json=fields)
     
     async def delete_lane(self, board_id: int, lane_id: int) -> bool:
@@ -1042,19 +1663,38 @@ class KaitenClient:
         Returns:
             True если удаление прошло успешно
         """
-        endpoint = KaitenConfig.ENDPOINT_LANES.format(board_id=board_id)
+        endpoint = KaitenConfig.ENDPOINT_LANES_FMT(board_id)
         await self._request('DELETE', f'{endpoint}/{lane_id}')
         return True
 
     # Методы для работы с пользовательскими свойствами
-    async def get_custom_properties(self) -> List[Property]:
+    async def get_custom_properties(self) -> Sequence[Property]:
         """Получает список всех пользовательских свойств.
         
         Returns:
-            List[Property]: Список объектов Property
+            Sequence[Property]: Список объектов Property (создаются по требованию)
+        """
+        data = await self._request("GET", KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES, cache=KaitenConfig.CACHE_ENTITY)
+        return LazyModelList(self, data, Property)
+    
+    async def _get_property_name_map(self) -> Dict[str, int]:
+        """
+        Возвращает словарь {название кастомного свойства: ID}.
+        
+        Словарь строится по списку свойств и хранится PROPERTY_NAMES_TTL секунд;
+        создание, изменение и удаление свойств через клиент сбрасывает его.
+        При совпадении названий берётся первое свойство из списка.
         """
-        data = await self._request("GET", KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES)
-        return [Property(client=self, data=item) for item in data]
+        cached = self._property_names
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        data = await self._request("GET", KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES, cache=KaitenConfig.CACHE_ENTITY)
+        names: Dict[str, int] = {}
+        for row in data:
+            names.setdefault(row.get('name'), row.get('id'))
+        self._property_names = (time.monotonic() + KaitenConfig.PROPERTY_NAMES_TTL, names)
+        return names
     
     async def get_custom_property(self, property_id: int) -> Property:
         """Получает пользовательское свойство по ID.
@@ -1065,7 +1705,7 @@ class KaitenClient:
         Returns:
             Property: Объект Property
         """
-        data = await self._request("GET", f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}")
+        data = await self._request("GET", f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}", conditional=True)
         return Property(client=self, data=data)
     
     async def create_custom_property(
@@ -1102,25 +1742,11 @@ class KaitenClient:
         Returns:
             Property: Созданный объект Property
         """
-        payload = {
-            "name": name,
-            "type": property_type,
-            "show_on_facade": show_on_facade,
-            "multiline": multiline,
-            "vote_variant": vote_variant,
-            "values_type": values_type,
-            "colorful": colorful,
-            "multi_select": multi_select,
-            "data": data,
-            "formula": formula,
-            "color": color,
-            "fields_settings": fields_settings
-        }
-        
-        # Удаляем None значения
-        payload = {k: v for k, v in payload.items() if v is not None}
+        # В тело попадают только поля со значением, отличным от None
+        payload = _build_params(_CUSTOM_PROPERTY_FIELDS, locals())
         
         data = await self._request("POST", KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES, json=payload)
+        self._property_names = None
         return Property(client=self, data=data)
     
     async def update_custom_property(
@@ -1157,31 +1783,10 @@ class KaitenClient:
         Returns:
             Property: Обновлённый объект Property
         """
-        payload = {}
-        if name is not None:
-            payload["name"] = name
-        if show_on_facade is not None:
-            payload["show_on_facade"] = show_on_facade
-        if multiline is not None:
-            payload["multiline"] = multiline
-        if vote_variant is not None:
-            payload["vote_variant"] = vote_variant
-        if values_type is not None:
-            payload["values_type"] = values_type
-        if colorful is not None:
-            payload["colorful"] = colorful
-        if multi_select is not None:
-            payload["multi_select"] = multi_select
-        if data is not None:
-            payload["data"] = data
-        if formula is not None:
-            payload["formula"] = formula
-        if color is not None:
-            payload["color"] = color
-        if fields_settings is not None:
-            payload["fields_settings"] = fields_settings
+        payload = _build_params(_CUSTOM_PROPERTY_UPDATE_FIELDS, locals())
         
         data = await self._request("PATCH", f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}", json=payload)
+        self._property_names = None
         return Property(client=self, data=data)
     
     async def delete_custom_property(self, property_id: int) -> bool:
@@ -1194,6 +1799,7 @@ class KaitenClient:
             bool: True если удаление прошло успешно
         """
         await self._request("DELETE", f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}")
+        self._property_names = None
         return True
 
     # === ЗНАЧЕНИЯ ВЫБОРА КАСТОМНЫХ СВОЙСТВ ===
@@ -1225,26 +1831,11 @@ class KaitenClient:
         Returns:
             Список значений выбора
         """
-        params = {}
+        params = _build_params(_SELECT_VALUES_PARAMS, locals())
         
-        if v2_select_search is not None:
-            params['v2_select_search'] = v2_select_search
-        if query is not None:
-            params['query'] = query
-        if order_by is not None:
-            params['order_by'] = order_by
-        if ids is not None:
-            params['ids'] = ','.join(map(str, ids))
-        if conditions is not None:
-            params['conditions'] = ','.join(conditions)
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        
-        endpoint = f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}/select-values"
+        endpoint = KaitenConfig.ENDPOINT_PROPERTY_SELECT_VALUES_FMT(property_id)
         response = await self._request('GET', endpoint, params=params)
-        return response if isinstance(response, list) else response.get('items', [])
+        return _items(response)
     
     async def get_property_select_value(
         self,
@@ -1261,8 +1852,8 @@ class KaitenClient:
         Returns:
             Значение выбора
         """
-        endpoint = f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}/select-values/{value_id}"
-        return await self._request('GET', endpoint)
+        endpoint = f"{KaitenConfig.ENDPOINT_PROPERTY_SELECT_VALUES_FMT(property_id)}/{value_id}"
+        return await self._request('GET', endpoint, conditional=True)
     
     async def create_property_select_value(
         self,
@@ -1286,9 +1877,33 @@ class KaitenClient:
         if color is not None:
             data['color'] = color
         
-        endpoint = f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}/select-values"
+        endpoint = KaitenConfig.ENDPOINT_PROPERTY_SELECT_VALUES_FMT(property_id)
         return await self._request('POST', endpoint, json=data)
     
+    async def bulk_create_property_select_values(
+        self,
+        property_id: int,
+        items: List[Dict[str, Any]],
+        concurrency: int = KaitenConfig.BULK_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Создаёт несколько значений выбора для кастомного свойства.
+        
+        В API нет пакетного эндпоинта, поэтому значения создаются параллельно,
+        не более `concurrency` запросов одновременно (в пределах лимита запросов в секунду).
+        
+        Args:
+            property_id: ID кастомного свойства
+            items: Аргументы create_property_select_value для каждого значения,
+                например [{'value': 'Новая'}, {'value': 'Готово', 'color': 3}]
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Созданные значения выбора в порядке items
+        """
+        return await _gather_bounded(
+            lambda item: self.create_property_select_value(property_id, **item), items, concurrency)
+    
     async def update_property_select_value(
         self,
         property_id: int,
@@ -1327,7 +1942,7 @@ class KaitenClient:
         if deleted is not None:
             data['deleted'] = deleted
         
-        endpoint = f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}/select-values/{value_id}"
+        endpoint = f"{KaitenConfig.ENDPOINT_PROPERTY_SELECT_VALUES_FMT(property_id)}/{value_id}"
         return await self._request('PATCH', endpoint, json=data)
     
     async def delete_property_select_value(
@@ -1345,7 +1960,7 @@ class KaitenClient:
         Returns:
             Удалённое значение выбора
         """
-        endpoint = f"{KaitenConfig.ENDPOINT_CUSTOM_PROPERTIES}/{property_id}/select-values/{value_id}"
+        endpoint = f"{KaitenConfig.ENDPOINT_PROPERTY_SELECT_VALUES_FMT(property_id)}/{value_id}"
         return await self._request('DELETE', endpoint)
 
     # === КАСТОМНЫЕ СВОЙСТВА КАРТОЧЕК ===
@@ -1360,12 +1975,29 @@ class KaitenClient:
         Returns:
             Dict с значениями кастомных свойств
         """
-        # Используем карточку с дополнительными полями для получения кастомных свойств
-        params = {'additional_card_fields': 'properties'}
-        card_data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}', params=params)
+        base_url = self.config.base_url
+        has_endpoint = self._has_props_endpoint.get(base_url)
+        if has_endpoint is not False:
+            # Отдельный эндпоинт возвращает только свойства, без остальных полей карточки
+            try:
+                properties = await self._request('GET', KaitenConfig.ENDPOINT_CARD_PROPERTIES_FMT(card_id))
+            except KaitenApiError as e:
+                # Сервер без эндпоинта может ответить не только 404, но и 400/405
+                # или страницей не в JSON (ответ 2xx). Временные ошибки (429, 5xx,
+                # сеть) пробрасываются: по ним нельзя судить об эндпоинте
+                if (has_endpoint or e.RETRYABLE or e.status_code is None
+                        or e.status_code >= 500):
+                    raise
+            else:
+                self._has_props_endpoint[base_url] = True
+                return properties or {}
         
-        # Возвращаем только кастомные свойства
-        return card_data.get('properties', {})
+        # Используем карточку с дополнительными полями для получения кастомных свойств
+        extras = await self.get_card_extras(card_id, ('properties',))
+        if has_endpoint is None:
+            # Ошибка была от отсутствия эндпоинта, а не карточки - больше не проверяем
+            self._has_props_endpoint[base_url] = False
+        return extras['properties']
     
     async def set_card_property_value(
         self, 
@@ -1384,32 +2016,26 @@ class KaitenClient:
         Returns:
             Dict с результатом операции
         """
-        # В Kaiten API кастомные свойства обновляются через обновление карточки
-        # с форматом id_{propertyId}:value
-        return await self.update_card(card_id, 
-                        properties={
-                            f"id_{property_id}": value}
-                        )
+        return await self.update_card_properties(card_id, {property_id: value})
     
-    async def update_card_property_value(
-        self, 
-        card_id: int, 
-        property_id: int, 
-        value: Any
-    ) -> Dict[str, Any]:
+    async def update_card_properties(self, card_id: int, values: Dict[int, Any]) -> Dict[str, Any]:
         """
-        Обновляет значение кастомного свойства карточки.
-        Алиас для set_card_property_value.
+        Устанавливает значения нескольких кастомных свойств карточки одним запросом.
         
         Args:
             card_id: ID карточки
-            property_id: ID кастомного свойства
-            value: Новое значение
+            values: Словарь {property_id: value}; None удаляет значение
         
         Returns:
-            Dict с результатом операции
+            Обновленная карточка
         """
-        return await self.set_card_property_value(card_id, property_id, value)
+        # В Kaiten API кастомные свойства обновляются через обновление карточки
+        # с форматом id_{propertyId}:value
+        properties = {f"id_{property_id}": value for property_id, value in values.items()}
+        return await self.update_card(card_id, properties=properties)
+    
+    # Алиас для set_card_property_value: тот же метод, без лишней промежуточной корутины
+    update_card_property_value = set_card_property_value
     
     async def delete_card_property_value(self, card_id: int, property_id: int) -> bool:
         """
@@ -1423,13 +2049,12 @@ class KaitenClient:
             True если удаление прошло успешно
         """
         # Удаление = установка значения в null
-        await self.set_card_property_value(card_id, 
-                                           property_id, None)
+        await self.update_card_properties(card_id, {property_id: None})
         return True
 
     # === ЧЕКИСТЫ ===
     
-    async def get_card_checklists(self, card_id: int) -> List[Checklist]:
+    async def get_card_checklists(self, card_id: int) -> Sequence[Checklist]:
         """
         Получает все чек-листы карточки.
         
@@ -1443,17 +2068,11 @@ class KaitenClient:
             Список чек-листов карточки
         """
         # Получаем карточку с дополнительными полями, включая чек-листы
-        params = {'additional_card_fields': 'checklists'}
-        card_data = await self._request('GET', f'{KaitenConfig.ENDPOINT_CARDS}/{card_id}', params=params)
-        
-        # Извлекаем чек-листы из данных карточки
-        checklists_data = card_data.get('checklists', [])
+        extras = await self.get_card_extras(card_id, ('checklists',))
+        checklists_data = extras['checklists']
         
-        # Добавляем card_id к каждому чек-листу
-        for checklist_data in checklists_data:
-            checklist_data['card_id'] = card_id
-        
-        return [Checklist(self, checklist_data) for checklist_data in checklists_data]
+        # card_id передаётся чек-листу при создании объекта, данные API не изменяются
+        return LazyModelList(self, checklists_data, Checklist, extra={'card_id': card_id})
     
     async def get_checklist(self, card_id: int, checklist_id: int) -> Checklist:
         """
@@ -1466,10 +2085,9 @@ class KaitenClient:
         Returns:
             Объект чек-листа
         """
-        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS.format(card_id=card_id)
-        data = await self._request('GET', f'{endpoint}/{checklist_id}')
-        data['card_id'] = card_id
-        return Checklist(self, data)
+        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS_FMT(card_id)
+        data = await self._request('GET', f'{endpoint}/{checklist_id}', conditional=True)
+        return Checklist(self, data, card_id=card_id)
     
     async def create_checklist(
         self,
@@ -1494,21 +2112,11 @@ class KaitenClient:
         Returns:
             Созданный чек-лист
         """
-        data = {'name': name}
+        data = _build_params(_CHECKLIST_FIELDS, locals())
         
-        if sort_order is not None:
-            data['sort_order'] = sort_order
-        if items_source_checklist_id is not None:
-            data['items_source_checklist_id'] = items_source_checklist_id
-        if exclude_item_ids is not None:
-            data['exclude_item_ids'] = exclude_item_ids
-        if source_share_id is not None:
-            data['source_share_id'] = source_share_id
-        
-        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS_FMT(card_id)
         checklist_data = await self._request('POST', endpoint, json=data)
-        checklist_data['card_id'] = card_id
-        return Checklist(self, checklist_data)
+        return Checklist(self, checklist_data, card_id=card_id)
     
     async def update_checklist(
         self,
@@ -1531,18 +2139,11 @@ class KaitenClient:
         Returns:
             Обновленный чек-лист
         """
-        data = {}
-        if name is not None:
-            data['name'] = name
-        if sort_order is not None:
-            data['sort_order'] = sort_order
-        if move_to_card_id is not None:
-            data['card_id'] = move_to_card_id
+        data = _build_params(_CHECKLIST_UPDATE_FIELDS, locals())
         
-        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS_FMT(card_id)
         checklist_data = await self._request('PATCH', f'{endpoint}/{checklist_id}', json=data)
-        checklist_data['card_id'] = move_to_card_id if move_to_card_id else card_id
-        return Checklist(self, checklist_data)
+        return Checklist(self, checklist_data, card_id=move_to_card_id if move_to_card_id else card_id)
     
     async def delete_checklist(self, card_id: int, checklist_id: int) -> bool:
         """
@@ -1555,7 +2156,7 @@ class KaitenClient:
         Returns:
             True если удаление прошло успешно
         """
-        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS.format(card_id=card_id)
+        endpoint = KaitenConfig.ENDPOINT_CARD_CHECKLISTS_FMT(card_id)
         await self._request('DELETE', f'{endpoint}/{checklist_id}')
         return True
     
@@ -1586,28 +2187,11 @@ class KaitenClient:
         Returns:
             Созданный элемент чек-листа
         """
-        data = {'text': text}
+        data = _build_params(_CHECKLIST_ITEM_FIELDS, locals())
         
-        if sort_order is not None:
-            data['sort_order'] = sort_order
-        if checked is not None:
-            data['checked'] = checked
-        if due_date is not None:
-            data['due_date'] = due_date
-        if responsible_id is not None:
-            data['responsible_id'] = responsible_id
-        
-        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS.format(
-            card_id=card_id, 
-            checklist_id=checklist_id
-        )
+        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS_FMT(card_id, checklist_id)
         item_data = await self._request('POST', endpoint, json=data)
-        
-        # Добавляем контекстную информацию
-        item_data['card_id'] = card_id
-        item_data['checklist_id'] = checklist_id
-        
-        return ChecklistItem(self, item_data)
+        return ChecklistItem(self, item_data, card_id=card_id, checklist_id=checklist_id)
     
     async def update_checklist_item(
         self,
@@ -1638,31 +2222,61 @@ class KaitenClient:
         Returns:
             Обновленный элемент чек-листа
         """
-        data = {}
-        if text is not None:
-            data['text'] = text
-        if sort_order is not None:
-            data['sort_order'] = sort_order
-        if checklist_id_new is not None:
-            data['checklist_id'] = checklist_id_new
-        if checked is not None:
-            data['checked'] = checked
-        if due_date is not None:
-            data['due_date'] = due_date
-        if responsible_id is not None:
-            data['responsible_id'] = responsible_id
-        
-        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS.format(
-            card_id=card_id, 
-            checklist_id=checklist_id
-        )
+        data = _build_params(_CHECKLIST_ITEM_UPDATE_FIELDS, locals())
+        
+        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS_FMT(card_id, checklist_id)
         item_data = await self._request('PATCH', f'{endpoint}/{item_id}', json=data)
+        return ChecklistItem(self, item_data, card_id=card_id,
+                             checklist_id=checklist_id_new if checklist_id_new else checklist_id)
+    
+    async def add_checklist_items_bulk(
+        self,
+        card_id: int,
+        checklist_id: int,
+        items: List[Dict[str, Any]],
+        concurrency: int = KaitenConfig.BULK_CONCURRENCY
+    ) -> List[ChecklistItem]:
+        """
+        Добавляет несколько элементов в чек-лист.
+        
+        В API нет пакетного эндпоинта, поэтому элементы создаются параллельно,
+        не более `concurrency` запросов одновременно (в пределах лимита запросов в секунду).
+        
+        Args:
+            card_id: ID карточки
+            checklist_id: ID чек-листа
+            items: Аргументы add_checklist_item для каждого элемента,
+                например [{'text': 'Шаг 1'}, {'text': 'Шаг 2', 'checked': True}]
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Созданные элементы в порядке items
+        """
+        return await _gather_bounded(
+            lambda item: self.add_checklist_item(card_id, checklist_id, **item), items, concurrency)
+    
+    async def update_checklist_items_bulk(
+        self,
+        card_id: int,
+        checklist_id: int,
+        items: List[Dict[str, Any]],
+        concurrency: int = KaitenConfig.BULK_CONCURRENCY
+    ) -> List[ChecklistItem]:
+        """
+        Обновляет несколько элементов чек-листа параллельно.
         
-        # Добавляем контекстную информацию
-        item_data['card_id'] = card_id
-        item_data['checklist_id'] = checklist_id_new if checklist_id_new else checklist_id
+        Args:
+            card_id: ID карточки
+            checklist_id: ID чек-листа
+            items: Аргументы update_checklist_item для каждого элемента, включая item_id,
+                например [{'item_id': 1, 'checked': True}, {'item_id': 2, 'text': 'Шаг 2'}]
+            concurrency: Максимальное количество одновременных запросов
         
-        return ChecklistItem(self, item_data)
+        Returns:
+            Обновлённые элементы в порядке items
+        """
+        return await _gather_bounded(
+            lambda item: self.update_checklist_item(card_id, checklist_id, **item), items, concurrency)
     
     async def delete_checklist_item(
         self,
@@ -1681,9 +2295,6 @@ class KaitenClient:
         Returns:
             True если удаление прошло успешно
         """
-        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS.format(
-            card_id=card_id, 
-            checklist_id=checklist_id
-        )
+        endpoint = KaitenConfig.ENDPOINT_CHECKLIST_ITEMS_FMT(card_id, checklist_id)
         await self._request('DELETE', f'{endpoint}/{item_id}')
         return True
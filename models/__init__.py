@@ -2,7 +2,7 @@
 Модели данных для Kaiten API клиента.
 """
 
-from .base import KaitenObject
+from .base import KaitenObject, LazyModelList
 from .space import Space
 from .board import Board
 from .column import Column
@@ -18,6 +18,7 @@ from .checklist_item import ChecklistItem
 
 __all__ = [
     'KaitenObject',
+    'LazyModelList',
     'Space',
     'Board',
     'Column',
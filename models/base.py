@@ -2,13 +2,33 @@
 Базовый класс для всех объектов Kaiten API.
 """
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import functools
+from collections.abc import Sequence
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Type, TYPE_CHECKING
 from datetime import datetime
+from types import MappingProxyType
 
 if TYPE_CHECKING:
     from ..kaiten_client import KaitenClient
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    """
+    Парсинг непустой строки даты ISO формата; None если формат некорректен.
+    
+    Результаты кэшируются (LRU): у карточек одной доски часто совпадают даты,
+    а datetime неизменяем, поэтому один объект можно отдавать многократно.
+    """
+    try:
+        # Kaiten использует ISO формат с Z в конце
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 class KaitenObject:
     """
     Базовый класс для всех объектов Kaiten.
@@ -16,6 +36,8 @@ class KaitenObject:
     Предоставляет общие методы и свойства для работы с данными из API.
     """
     
+    __slots__ = ('_client', '_data', '_id')
+    
     def __init__(self, client: 'KaitenClient', data: Dict[str, Any]):
         """
         Инициализация объекта.
@@ -28,14 +50,40 @@ class KaitenObject:
         self._data = data
         self._id = data.get('id')
     
+    @classmethod
+    def from_list(cls, client: 'KaitenClient', rows: List[Dict[str, Any]]) -> List['KaitenObject']:
+        """
+        Создаёт объекты из списка данных API.
+        
+        Атрибуты заполняются напрямую, минуя вызов __init__ для каждой строки.
+        
+        Args:
+            client: Экземпляр KaitenClient для выполнения API запросов
+            rows: Список данных объектов из API
+        """
+        new = cls.__new__
+        objects = []
+        append = objects.append
+        for row in rows:
+            obj = new(cls)
+            obj._client = client
+            obj._data = row
+            obj._id = row.get('id')
+            append(obj)
+        return objects
+    
     @property
     def id(self) -> Optional[int]:
         """ID объекта."""
         return self._id
     
     @property
-    def data(self) -> Dict[str, Any]:
-        """Сырые данные объекта."""
+    def data(self) -> Mapping[str, Any]:
+        """Сырые данные объекта (представление только для чтения, без копирования)."""
+        return MappingProxyType(self._data)
+    
+    def data_copy(self) -> Dict[str, Any]:
+        """Копия сырых данных объекта, которую можно изменять."""
         return self._data.copy()
     
     def __getitem__(self, key: str) -> Any:
@@ -60,26 +108,19 @@ class KaitenObject:
     
     def __eq__(self, other) -> bool:
         """Сравнение объектов по ID."""
-        if not isinstance(other, KaitenObject):
-            return False
-        return self.id == other.id and self.__class__ == other.__class__
+        # Совпадение класса исключает и объекты других типов, поэтому isinstance не нужен
+        return other.__class__ is self.__class__ and other._id == self._id
     
     def __hash__(self) -> int:
         """Хэш объекта на основе ID и типа."""
-        return hash((self.__class__, self.id))
+        return hash((self.__class__, self._id))
     
     @staticmethod
     def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-        """Парсинг даты из строки ISO формата."""
-        if not value:
-            return None
-        try:
-            # Kaiten использует ISO формат с Z в конце
-            if value.endswith('Z'):
-                value = value[:-1] + '+00:00'
-            return datetime.fromisoformat(value)
-        except (ValueError, TypeError):
+        """Парсинг даты из строки ISO формата; None для пустых и нестроковых значений."""
+        if not value or not isinstance(value, str):
             return None
+        return _parse_iso_datetime(value)
     
     def refresh(self):
         """
@@ -104,3 +145,66 @@ class KaitenObject:
         Метод должен быть переопределен в наследниках для конкретных эндпоинтов.
         """
         raise NotImplementedError("Subclasses must implement delete method")
+
+
+class LazyModelList(Sequence):
+    """
+    Список объектов Kaiten, создаваемых по требованию.
+    
+    Хранит сырые данные API и создаёт объект модели только при первом обращении
+    к элементу, поэтому непрочитанные элементы не стоят ни объекта, ни вызова __init__.
+    Поддерживает len, индексы, срезы (возвращают list), итерацию и `in`.
+    """
+    
+    __slots__ = ('_client', '_rows', '_cls', '_extra', '_items')
+    
+    def __init__(self, client: 'KaitenClient', rows: List[Dict[str, Any]],
+                 cls: Type[KaitenObject], extra: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            client: Экземпляр KaitenClient для выполнения API запросов
+            rows: Список данных объектов из API
+            cls: Класс модели для элементов
+            extra: Дополнительные именованные аргументы from_list класса модели
+                (например, card_id для Checklist)
+        """
+        self._client = client
+        self._rows = rows
+        self._cls = cls
+        self._extra = extra
+        self._items: List[Optional[KaitenObject]] = [None] * len(rows)
+    
+    def _build(self, index: int) -> KaitenObject:
+        item = self._items[index]
+        if item is None:
+            rows = (self._rows[index],)
+            if self._extra:
+                item = self._cls.from_list(self._client, rows, **self._extra)[0]
+            else:
+                item = self._cls.from_list(self._client, rows)[0]
+            self._items[index] = item
+        return item
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self._rows)))]
+        if index < 0:
+            index += len(self._rows)
+        if not 0 <= index < len(self._rows):
+            raise IndexError("LazyModelList index out of range")
+        return self._build(index)
+    
+    def __iter__(self) -> Iterator[KaitenObject]:
+        for index in range(len(self._rows)):
+            yield self._build(index)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyModelList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"LazyModelList({self._cls.__name__}, {len(self._rows)} items)"
@@ -2,7 +2,7 @@
 Модель для работы с досками Kaiten.
 """
 
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import AsyncIterator, List, Optional, Dict, Any, Union, Sequence, TYPE_CHECKING
 from .base import KaitenObject
 
 if TYPE_CHECKING:
@@ -18,6 +18,8 @@ class Board(KaitenObject):
     Предоставляет методы для управления доской и получения её колонок и карточек.
     """
     
+    __slots__ = ()
+    
     @property
     def title(self) -> Optional[str]:
         """Название доски."""
@@ -183,7 +185,7 @@ class Board(KaitenObject):
         """
         return await self._client.delete_board(self.space_id, self.id)
     
-    async def get_columns(self) -> List['Column']:
+    async def get_columns(self) -> Sequence['Column']:
         """
         Получить все колонки доски.
         
@@ -213,7 +215,7 @@ class Board(KaitenObject):
             position=position
         )
     
-    async def get_lanes(self) -> List['Lane']:
+    async def get_lanes(self) -> Sequence['Lane']:
         """
         Получить все дорожки доски.
         
@@ -252,19 +254,31 @@ class Board(KaitenObject):
             **kwargs
         )
     
-    async def get_cards(self, **filters) -> List['Card']:
+    async def get_cards(self, all_pages: bool = False, **filters) -> List['Card']:
         """
         Получить карточки доски с расширенными фильтрами.
         
         Args:
+            all_pages: Загрузить карточки со всех страниц (limit и offset задаются автоматически)
             **filters: Любые фильтры поддерживаемые API (created_before, created_after, 
                       updated_before, updated_after, query, tag, states, archived и т.д.)
         
         Returns:
             Список объектов Card
         """
+        if all_pages:
+            return await self._client.get_all_cards(board_id=self.id, **filters)
         return await self._client.get_cards(board_id=self.id, **filters)
     
+    def iter_cards(self, **filters) -> AsyncIterator['Card']:
+        """
+        Перебрать все карточки доски по мере загрузки страниц (см. KaitenClient.iter_cards).
+        
+        Args:
+            **filters: Фильтры get_cards (limit и offset задаются автоматически)
+        """
+        return self._client.iter_cards(board_id=self.id, **filters)
+    
     async def create_card(
         self,
         title: str,
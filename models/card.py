@@ -2,7 +2,8 @@
 Модель для работы с карточками Kaiten.
 """
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple, Sequence, TYPE_CHECKING
 from .base import KaitenObject
 
 if TYPE_CHECKING:
@@ -20,6 +21,8 @@ class Card(KaitenObject):
     (комментарии, файлы, участники).
     """
     
+    __slots__ = ()
+    
     @property
     def title(self) -> Optional[str]:
         """Название карточки."""
@@ -121,6 +124,20 @@ class Card(KaitenObject):
         """
         return await self.update(column_id=column_id)
     
+    async def get_related(self) -> Tuple[List['Comment'], List['Member'], List['File']]:
+        """
+        Получить комментарии, участников и файлы карточки одновременно.
+        
+        Returns:
+            Кортеж (комментарии, участники, файлы)
+        """
+        comments, members, files = await asyncio.gather(
+            self._client.get_card_comments(self.id),
+            self._client.get_card_members(self.id),
+            self._client.get_card_files(self.id),
+        )
+        return comments, members, files
+    
     # === КОММЕНТАРИИ ===
     
     async def get_comments(self) -> List['Comment']:
@@ -205,7 +222,7 @@ class Card(KaitenObject):
     
     # === ЧЕКИСТЫ ===
     
-    async def get_checklists(self) -> List['Checklist']:
+    async def get_checklists(self) -> Sequence['Checklist']:
         """
         Получить все чек-листы карточки.
         
@@ -283,21 +300,15 @@ class Card(KaitenObject):
         Returns:
             Результат операции
         """
-        # Получаем все кастомные свойства
-        properties = await self._client.get_custom_properties()
+        # Словарь {название: ID} кэшируется клиентом, поэтому повторные вызовы
+        # не загружают список свойств заново
+        property_names = await self._client._get_property_name_map()
+        property_id = property_names.get(property_name)
         
-        # Ищем свойство по названию
-        target_property = None
-        for prop in properties:
-            if prop.name == property_name:
-                target_property = prop
-                break
-        
-        if not target_property:
+        if property_id is None:
             raise ValueError(f"Кастомное свойство с названием '{property_name}' не найдено")
         
-        return await self._client.set_card_property_value(
-            self.id, target_property.id, value)
+        return await self._client.set_card_property_value(self.id, property_id, value)
     
     async def update_property_value(self, property_id: int, value: Any) -> Dict[str, Any]:
         """
@@ -338,13 +349,25 @@ class Card(KaitenObject):
         Returns:
             Результат операции
         """
-        # Формируем данные в формате id_{propertyId}:value
-        update_data = {}
-        for property_id, value in properties.items():
-            update_data[f"id_{property_id}"] = value
+        return await self._client.update_card_properties(self.id, properties)
+    
+    async def set_property_values_by_name(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Установить значения нескольких кастомных свойств по их названиям одним запросом.
+        
+        Args:
+            values: Словарь {название свойства: значение}
+        
+        Returns:
+            Результат операции
+        """
+        property_names = await self._client._get_property_name_map()
+        missing = [name for name in values if name not in property_names]
+        if missing:
+            raise ValueError(f"Кастомные свойства с названиями {missing} не найдены")
         
-        return await self._client.update_card(self.id, 
-                        properties=update_data)
+        return await self._client.update_card_properties(
+            self.id, {property_names[name]: value for name, value in values.items()})
 
     def __str__(self) -> str:
         """Строковое представление карточки."""
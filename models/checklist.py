@@ -2,14 +2,19 @@
 Модель чек-листа карточки для Kaiten API.
 """
 
+import operator
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
-from datetime import datetime
+from datetime import date
 
 from .base import KaitenObject
+from .checklist_item import ChecklistItem, _parse_due_date
 
 if TYPE_CHECKING:
     from ..kaiten_client import KaitenClient
-    from .checklist_item import ChecklistItem
+
+
+# item.get('checked', False) для map(): перебор элементов без генератора на Python
+_item_checked = operator.methodcaller('get', 'checked', False)
 
 
 class Checklist(KaitenObject):
@@ -19,12 +24,28 @@ class Checklist(KaitenObject):
     Чек-лист содержит упорядоченный список элементов (ChecklistItem),
     которые можно отмечать как выполненные, назначать ответственных и устанавливать сроки.
     """
-
-    @property
-    def id(self) -> Optional[int]:
-        """ID чек-листа."""
-        return self._data.get('id')
     
+    __slots__ = ('_card_id',)
+    
+    def __init__(self, client: 'KaitenClient', data: Dict[str, Any], card_id: Optional[int] = None):
+        """
+        Args:
+            client: Экземпляр KaitenClient для выполнения API запросов
+            data: Данные чек-листа из API
+            card_id: ID карточки (API не всегда возвращает его в данных чек-листа)
+        """
+        super().__init__(client, data)
+        self._card_id = card_id if card_id is not None else data.get('card_id')
+    
+    @classmethod
+    def from_list(cls, client: 'KaitenClient', rows: List[Dict[str, Any]],
+                  card_id: Optional[int] = None) -> List['Checklist']:
+        """Создаёт чек-листы из списка данных API, привязывая их к карточке card_id."""
+        checklists = super().from_list(client, rows)
+        for checklist in checklists:
+            checklist._card_id = card_id if card_id is not None else checklist._data.get('card_id')
+        return checklists
+
     @property
     def name(self) -> Optional[str]:
         """Название чек-листа."""
@@ -63,7 +84,7 @@ class Checklist(KaitenObject):
     @property
     def card_id(self) -> Optional[int]:
         """ID карточки, к которой принадлежит чек-лист."""
-        return self._data.get('card_id')
+        return self._card_id
     
     @property
     def items(self) -> Optional[List[Dict[str, Any]]]:
@@ -114,6 +135,7 @@ class Checklist(KaitenObject):
             move_to_card_id=card_id
         )
         self._data = updated_checklist._data
+        self._card_id = updated_checklist.card_id
         return self
     
     async def delete(self) -> bool:
@@ -171,18 +193,9 @@ class Checklist(KaitenObject):
         Returns:
             Список элементов чек-листа
         """
-        from .checklist_item import ChecklistItem
-        
-        items_data = self.items or []
-        result = []
-        
-        for item_data in items_data:
-            # Добавляем контекстную информацию
-            item_data['card_id'] = self.card_id
-            item_data['checklist_id'] = self.id
-            result.append(ChecklistItem(self._client, item_data))
-        
-        return result
+        # Карточка и чек-лист передаются элементам при создании, данные API не изменяются
+        return ChecklistItem.from_list(self._client, self.items or [],
+                                       card_id=self.card_id, checklist_id=self.id)
     
     # === СТАТИСТИЧЕСКИЕ МЕТОДЫ ===
     
@@ -195,13 +208,20 @@ class Checklist(KaitenObject):
         """
         items = self.items or []
         total = len(items)
-        completed = sum(1 for item in items if item.get('checked', False))
-        percentage = (completed / total * 100) if total > 0 else 0
+        completed = sum(map(bool, map(_item_checked, items)))
+        percentage = 0
+        if total > 0:
+            # Процент с точностью до сотых в целых числах, половина округляется
+            # к чётному, как у round()
+            hundredths, remainder = divmod(completed * 10000, total)
+            if remainder * 2 > total or (remainder * 2 == total and hundredths % 2):
+                hundredths += 1
+            percentage = hundredths / 100
         
         return {
             'total': total,
             'completed': completed,
-            'percentage': round(percentage, 2)
+            'percentage': percentage
         }
     
     def is_completed(self) -> bool:
@@ -211,8 +231,9 @@ class Checklist(KaitenObject):
         Returns:
             True если все элементы отмечены как выполненные
         """
-        items = self.items or []
-        return len(items) > 0 and all(item.get('checked', False) for item in items)
+        items = self._data.get('items')
+        # all() останавливается на первом неотмеченном элементе
+        return bool(items) and all(map(_item_checked, items))
     
     def get_overdue_items(self) -> List[Dict[str, Any]]:
         """
@@ -221,21 +242,16 @@ class Checklist(KaitenObject):
         Returns:
             Список просроченных элементов
         """
-        from datetime import date
-        
         today = date.today()
         overdue_items = []
         
         for item in self.items or []:
             due_date_str = item.get('due_date')
             if due_date_str and not item.get('checked', False):
-                try:
-                    due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
-                    if due_date < today:
-                        overdue_items.append(item)
-                except ValueError:
-                    # Некорректный формат даты
-                    continue
+                # Некорректный формат даты разбирается в None и пропускается
+                due_date = _parse_due_date(due_date_str)
+                if due_date is not None and due_date < today:
+                    overdue_items.append(item)
         
         return overdue_items
     
@@ -2,15 +2,36 @@
 Модель элемента чек-листа карточки для Kaiten API.
 """
 
-from typing import Optional, TYPE_CHECKING
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, date
 
+from ..batch import _gather_bounded
+from ..config import KaitenConfig
 from .base import KaitenObject
 
 if TYPE_CHECKING:
     from ..kaiten_client import KaitenClient
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_due_date(value: str) -> Optional[date]:
+    """
+    Разбирает срок выполнения в формате YYYY-MM-DD; для некорректной строки возвращает None.
+    
+    Результаты кэшируются: у элементов чек-листов сроки обычно повторяются.
+    """
+    try:
+        # Обычный случай YYYY-MM-DD разбираем срезами, без разбора формата strptime
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            year, month, day = value[:4], value[5:7], value[8:]
+            if year.isdigit() and month.isdigit() and day.isdigit():
+                return date(int(year), int(month), int(day))
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
 class ChecklistItem(KaitenObject):
     """
     Модель элемента чек-листа карточки в Kaiten.
@@ -18,12 +39,34 @@ class ChecklistItem(KaitenObject):
     Элемент чек-листа представляет отдельную задачу в рамках чек-листа,
     которую можно отмечать как выполненную, назначать ответственного и устанавливать срок.
     """
-
-    @property
-    def id(self) -> Optional[int]:
-        """ID элемента чек-листа."""
-        return self._data.get('id')
     
+    __slots__ = ('_card_id', '_checklist_id')
+    
+    def __init__(self, client: 'KaitenClient', data: Dict[str, Any],
+                 card_id: Optional[int] = None, checklist_id: Optional[int] = None):
+        """
+        Args:
+            client: Экземпляр KaitenClient для выполнения API запросов
+            data: Данные элемента из API
+            card_id: ID карточки (API не возвращает его в данных элемента)
+            checklist_id: ID чек-листа (если не передан, берётся из данных)
+        """
+        super().__init__(client, data)
+        self._card_id = card_id if card_id is not None else data.get('card_id')
+        self._checklist_id = checklist_id if checklist_id is not None else data.get('checklist_id')
+    
+    @classmethod
+    def from_list(cls, client: 'KaitenClient', rows: List[Dict[str, Any]],
+                  card_id: Optional[int] = None,
+                  checklist_id: Optional[int] = None) -> List['ChecklistItem']:
+        """Создаёт элементы из списка данных API, привязывая их к карточке и чек-листу."""
+        items = super().from_list(client, rows)
+        for item in items:
+            data = item._data
+            item._card_id = card_id if card_id is not None else data.get('card_id')
+            item._checklist_id = checklist_id if checklist_id is not None else data.get('checklist_id')
+        return items
+
     @property
     def text(self) -> Optional[str]:
         """Текст элемента чек-листа."""
@@ -82,15 +125,62 @@ class ChecklistItem(KaitenObject):
     @property
     def card_id(self) -> Optional[int]:
         """ID карточки, к которой принадлежит чек-лист."""
-        return self._data.get('card_id')
+        return self._card_id
     
     @property
     def checklist_id(self) -> Optional[int]:
         """ID чек-листа, к которому принадлежит элемент."""
-        return self._data.get('checklist_id')
+        return self._checklist_id
     
     # === МЕТОДЫ УПРАВЛЕНИЯ ЭЛЕМЕНТОМ ===
     
+    async def refresh(self) -> 'ChecklistItem':
+        """
+        Обновляет данные элемента с сервера.
+        
+        Отдельного эндпоинта нет, поэтому загружается чек-лист, в котором лежит элемент.
+        
+        Returns:
+            Обновленный объект элемента чек-листа
+        """
+        await ChecklistItem.refresh_all((self,))
+        return self
+    
+    @classmethod
+    async def refresh_all(cls, items: Iterable['ChecklistItem'],
+                          concurrency: int = KaitenConfig.BULK_CONCURRENCY) -> List['ChecklistItem']:
+        """
+        Обновляет данные нескольких элементов чек-листов с сервера.
+        
+        Элементы группируются по чек-листам: каждый чек-лист загружается один раз,
+        разные чек-листы - параллельно, не более `concurrency` запросов одновременно.
+        
+        Args:
+            items: Элементы чек-листов
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Те же элементы в исходном порядке
+        """
+        items = list(items)
+        groups: Dict[Tuple[int, int], List['ChecklistItem']] = {}
+        for item in items:
+            if not item.id or not item.card_id or not item.checklist_id:
+                raise ValueError("ID элемента, ID карточки и ID чек-листа должны быть установлены")
+            groups.setdefault((item.card_id, item.checklist_id), []).append(item)
+        
+        async def refresh_group(entry: Tuple[Tuple[int, int], List['ChecklistItem']]) -> None:
+            (card_id, checklist_id), group = entry
+            checklist = await group[0]._client.get_checklist(card_id, checklist_id)
+            rows = {row.get('id'): row for row in checklist.items or []}
+            for item in group:
+                row = rows.get(item.id)
+                if row is not None:
+                    item._data = row
+        
+        await _gather_bounded(refresh_group, groups.items(), concurrency)
+        return items
+    
     async def update(
         self,
         text: Optional[str] = None,
@@ -135,6 +225,7 @@ class ChecklistItem(KaitenObject):
             responsible_id=responsible_id
         )
         self._data = updated_item._data
+        self._checklist_id = updated_item.checklist_id
         return self
     
     async def delete(self) -> bool:
@@ -163,6 +254,34 @@ class ChecklistItem(KaitenObject):
         new_checked = not (self.checked or False)
         return await self.update(checked=new_checked)
     
+    @classmethod
+    async def set_checked_all(cls, items: Iterable['ChecklistItem'], checked: Optional[bool] = None,
+                              concurrency: int = KaitenConfig.BULK_CONCURRENCY) -> List['ChecklistItem']:
+        """
+        Отмечает, снимает отметку или переключает несколько элементов параллельно.
+        
+        Элементы могут принадлежать разным чек-листам. При заданном `checked` элементы,
+        которые уже в нужном состоянии, пропускаются без запроса к API.
+        
+        Args:
+            items: Элементы чек-листов
+            checked: Новое состояние; None - переключить каждый элемент
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Те же элементы в исходном порядке
+        """
+        items = list(items)
+        changes = []
+        for item in items:
+            current = item.checked or False
+            new_checked = not current if checked is None else checked
+            if new_checked != current:
+                changes.append((item, new_checked))
+        
+        await _gather_bounded(lambda change: change[0].update(checked=change[1]), changes, concurrency)
+        return items
+    
     async def set_responsible(self, user_id: int) -> 'ChecklistItem':
         """
         Назначает ответственного за выполнение элемента.
@@ -195,9 +314,7 @@ class ChecklistItem(KaitenObject):
             Обновленный объект элемента
         """
         # Проверка формата даты
-        try:
-            datetime.strptime(due_date, '%Y-%m-%d')
-        except ValueError:
+        if _parse_due_date(due_date) is None:
             raise ValueError("Дата должна быть в формате YYYY-MM-DD")
         
         return await self.update(due_date=due_date)
@@ -213,61 +330,67 @@ class ChecklistItem(KaitenObject):
     
     # === ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ===
     
-    def is_overdue(self) -> bool:
+    def is_overdue(self, today: Optional[date] = None) -> bool:
         """
         Проверяет, просрочен ли элемент.
         
+        Args:
+            today: Текущая дата (по умолчанию date.today()); при проверке многих
+                элементов её можно вычислить один раз и передавать каждому
+        
         Returns:
             True если элемент просрочен (не выполнен и срок прошел)
         """
-        if not self.due_date or self.checked:
+        due_date = self.due_date
+        if not due_date or self.checked:
             return False
         
-        try:
-            due_date_obj = datetime.strptime(self.due_date, '%Y-%m-%d').date()
-            return due_date_obj < date.today()
-        except ValueError:
-            return False
+        due_date_obj = _parse_due_date(due_date)
+        return due_date_obj is not None and due_date_obj < (today or date.today())
     
-    def days_until_due(self) -> Optional[int]:
+    def days_until_due(self, today: Optional[date] = None) -> Optional[int]:
         """
         Возвращает количество дней до срока выполнения.
         
+        Args:
+            today: Текущая дата (по умолчанию date.today())
+        
         Returns:
             Количество дней (отрицательное значение для просроченных)
             или None если срок не установлен
         """
-        if not self.due_date:
+        due_date = self.due_date
+        if not due_date:
             return None
         
-        try:
-            due_date_obj = datetime.strptime(self.due_date, '%Y-%m-%d').date()
-            delta = due_date_obj - date.today()
-            return delta.days
-        except ValueError:
+        due_date_obj = _parse_due_date(due_date)
+        if due_date_obj is None:
             return None
+        return (due_date_obj - (today or date.today())).days
     
-    def get_status_text(self) -> str:
+    def get_status_text(self, today: Optional[date] = None) -> str:
         """
         Возвращает текстовое описание статуса элемента.
         
+        Args:
+            today: Текущая дата (по умолчанию date.today())
+        
         Returns:
             Строка с описанием статуса
         """
         if self.checked:
             return "Выполнено"
-        elif self.is_overdue():
+        
+        # Срок разбирается и сравнивается с сегодняшним днём один раз
+        days = self.days_until_due(today)
+        if days is None:
+            return "К выполнению"
+        elif days < 0:
             return "Просрочено"
-        elif self.due_date:
-            days = self.days_until_due()
-            if days == 0:
-                return "Срок сегодня"
-            elif days and days > 0:
-                return f"Осталось {days} дн."
-            else:
-                return "К выполнению"
+        elif days == 0:
+            return "Срок сегодня"
         else:
-            return "К выполнению"
+            return f"Осталось {days} дн."
     
     def __str__(self) -> str:
         """Строковое представление элемента чек-листа."""
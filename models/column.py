@@ -2,7 +2,7 @@
 Модель для работы с колонками Kaiten.
 """
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import AsyncIterator, List, Optional, Dict, Any, TYPE_CHECKING
 from .base import KaitenObject
 
 if TYPE_CHECKING:
@@ -16,6 +16,8 @@ class Column(KaitenObject):
     Предоставляет методы для управления колонкой и получения её карточек.
     """
     
+    __slots__ = ()
+    
     @property
     def title(self) -> Optional[str]:
         """Название колонки."""
@@ -70,22 +72,32 @@ class Column(KaitenObject):
         """
         return await self._client.delete_column(self.board_id, self.id)
     
-    async def get_cards(self, **filters) -> List['Card']:
+    async def get_cards(self, all_pages: bool = False, **filters) -> List['Card']:
         """
         Получить все карточки в колонке с расширенными фильтрами.
         
         Args:
+            all_pages: Загрузить карточки со всех страниц (limit и offset задаются автоматически)
             **filters: Любые фильтры поддерживаемые API (created_before, created_after, 
                       updated_before, updated_after, query, tag, states, archived и т.д.)
         
         Returns:
             Список объектов Card в этой колонке
         """
-        from .card import Card
-        
         # Используем фильтр column_id напрямую в API для более эффективного запроса
+        if all_pages:
+            return await self._client.get_all_cards(board_id=self.board_id, column_id=self.id, **filters)
         return await self._client.get_cards(board_id=self.board_id, column_id=self.id, **filters)
     
+    def iter_cards(self, **filters) -> AsyncIterator['Card']:
+        """
+        Перебрать все карточки колонки по мере загрузки страниц (см. KaitenClient.iter_cards).
+        
+        Args:
+            **filters: Фильтры get_cards (limit и offset задаются автоматически)
+        """
+        return self._client.iter_cards(board_id=self.board_id, column_id=self.id, **filters)
+    
     async def create_card(
         self,
         title: str,
@@ -11,6 +11,8 @@ class Comment(KaitenObject):
     Класс для работы с комментариями карточек Kaiten.
     """
     
+    __slots__ = ()
+    
     @property
     def text(self) -> Optional[str]:
         """Текст комментария."""
@@ -38,13 +40,10 @@ class Comment(KaitenObject):
     
     async def refresh(self) -> 'Comment':
         """Обновить данные комментария из API."""
-        # Для комментариев нет отдельного эндпоинта получения по ID
-        # Нужно получить все комментарии карточки и найти нужный
-        comments_data = await self._client.get_card_comments(self.card_id)
-        for comment_data in comments_data:
-            if comment_data.get('id') == self.id:
-                self._data = comment_data
-                break
+        # Отдельного эндпоинта нет: клиент ищет объект в списке карточки
+        comment = await self._client.get_card_comment(self.card_id, self.id)
+        if comment is not None:
+            self._data = comment._data
         return self
     
     async def update(self, text: str) -> 'Comment':
@@ -2,15 +2,30 @@
 Модель для работы с файлами карточек Kaiten.
 """
 
+import os
 from typing import Optional
+from ..exceptions import KaitenApiError
 from .base import KaitenObject
 
+try:
+    import aiofiles
+except ImportError:  # aiofiles - необязательная зависимость, нужна только для записи на диск
+    aiofiles = None
+
+
+def _require_aiofiles() -> None:
+    """Проверяет, что aiofiles установлен."""
+    if aiofiles is None:
+        raise ImportError("Для сохранения файла на диск установите aiofiles: pip install aiofiles")
+
 
 class File(KaitenObject):
     """
     Класс для работы с файлами карточек Kaiten.
     """
     
+    __slots__ = ()
+    
     @property
     def name(self) -> Optional[str]:
         """Имя файла."""
@@ -58,13 +73,10 @@ class File(KaitenObject):
     
     async def refresh(self) -> 'File':
         """Обновить данные файла из API."""
-        # Для файлов нет отдельного эндпоинта получения по ID
-        # Нужно получить все файлы карточки и найти нужный
-        files_data = await self._client.get_card_files(self.card_id)
-        for file_data in files_data:
-            if file_data.get('id') == self.id:
-                self._data = file_data
-                break
+        # Отдельного эндпоинта нет: клиент ищет объект в списке карточки
+        file = await self._client.get_card_file(self.card_id, self.id)
+        if file is not None:
+            self._data = file._data
         return self
     
     async def delete(self) -> bool:
@@ -81,36 +93,82 @@ class File(KaitenObject):
         """Файлы не поддерживают обновление через API."""
         raise NotImplementedError("Files cannot be updated via API")
     
+    def _get_download_url(self) -> str:
+        """URL для скачивания файла."""
+        url = self.download_url or self.url
+        if not url:
+            raise ValueError("No download URL available for this file")
+        return url
+    
     async def download(self, save_path: Optional[str] = None) -> bytes:
         """
         Скачать файл.
         
+        Содержимое целиком загружается в память; чтобы только сохранить большой
+        файл на диск, используйте save().
+        
         Args:
             save_path: Путь для сохранения файла (опционально)
         
         Returns:
             Содержимое файла в байтах
         """
-        if not self.download_url and not self.url:
-            raise ValueError("No download URL available for this file")
-        
-        url = self.download_url or self.url
+        url = self._get_download_url()
         
         # Используем сессию клиента для скачивания
         async with self._client.session.get(url) as response:
             if response.status >= 400:
-                raise Exception(f"Failed to download file: {response.status}")
+                raise KaitenApiError.from_response(response.status, await response.text(), url)
             
             content = await response.read()
             
             # Если указан путь для сохранения, сохраняем файл
             if save_path:
-                import aiofiles
+                _require_aiofiles()
                 async with aiofiles.open(save_path, 'wb') as f:
                     await f.write(content)
             
             return content
     
+    async def save(self, save_path: str, chunk_size: int = 64 * 1024) -> int:
+        """
+        Скачать файл сразу на диск, по частям.
+        
+        В памяти одновременно находится не больше одной части. Данные пишутся
+        во временный файл рядом с save_path, который переименовывается в save_path
+        только после успешной загрузки: при ошибке недокачанный файл не остаётся.
+        
+        Args:
+            save_path: Путь для сохранения файла
+            chunk_size: Размер части в байтах
+        
+        Returns:
+            Количество записанных байт
+        """
+        url = self._get_download_url()
+        _require_aiofiles()
+        
+        written = 0
+        async with self._client.session.get(url) as response:
+            if response.status >= 400:
+                raise KaitenApiError.from_response(response.status, await response.text(), url)
+            
+            tmp_path = os.fspath(save_path) + '.part'
+            try:
+                async with aiofiles.open(tmp_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        await f.write(chunk)
+                        written += len(chunk)
+                os.replace(tmp_path, save_path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        
+        return written
+    
     def __str__(self) -> str:
         """Строковое представление файла."""
         size_str = f", {self.size} bytes" if self.size else ""
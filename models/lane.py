@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Any, Union, TYPE_CHECKING
+from ..batch import _gather_bounded
+from ..config import KaitenConfig
 from .base import KaitenObject
 
 if TYPE_CHECKING:
@@ -12,6 +14,8 @@ class Lane(KaitenObject):
     Предоставляет методы для управления дорожкой и получения её карточек.
     """
     
+    __slots__ = ()
+    
     @property
     def title(self) -> Optional[str]:
         """Название дорожки."""
@@ -89,8 +93,8 @@ class Lane(KaitenObject):
     
     async def refresh(self) -> 'Lane':
         """Обновить данные дорожки из API."""
-        data = await self._client.get_lane(self.board_id, self.id)
-        self._data = data
+        lane = await self._client.get_lane(self.board_id, self.id)
+        self._data = lane._data
         return self
     
     async def update(self, **fields) -> 'Lane':
@@ -116,22 +120,69 @@ class Lane(KaitenObject):
         """
         return await self._client.delete_lane(self.board_id, self.id)
     
-    async def get_cards(self, **filters) -> List['Card']:
+    async def get_cards(self, all_pages: bool = False, **filters) -> List['Card']:
         """
         Получить все карточки в дорожке с расширенными фильтрами.
         
         Args:
+            all_pages: Загрузить карточки со всех страниц (limit и offset задаются автоматически)
             **filters: Любые фильтры поддерживаемые API (created_before, created_after, 
                       updated_before, updated_after, query, tag, states, archived и т.д.)
         
         Returns:
             Список объектов Card в этой дорожке
         """
-        from .card import Card
-        
         # Используем фильтр lane_id напрямую в API для более эффективного запроса
+        if all_pages:
+            return await self._client.get_all_cards(board_id=self.board_id, lane_id=self.id, **filters)
         return await self._client.get_cards(board_id=self.board_id, lane_id=self.id, **filters)
     
+    async def get_cards_columns(self, fields: Iterable[str], **filters) -> Dict[str, List[Any]]:
+        """
+        Получить выбранные поля карточек дорожки по столбцам, без создания объектов Card.
+        
+        Подходит для больших выборок, где нужны только несколько полей
+        (например, id и title).
+        
+        Args:
+            fields: Имена полей карточки
+            **filters: Фильтры get_cards (limit, offset и фильтры API)
+        
+        Returns:
+            Словарь {поле: список значений}, значения идут в порядке карточек;
+            отсутствующее поле даёт None
+        """
+        rows = await self._client.get_cards(board_id=self.board_id, lane_id=self.id,
+                                            raw=True, **filters)
+        return {field: [row.get(field) for row in rows] for field in fields}
+    
+    @classmethod
+    async def get_cards_for(cls, lanes: Iterable['Lane'], concurrency: int = KaitenConfig.BULK_CONCURRENCY,
+                            **filters) -> List[List['Card']]:
+        """
+        Получить карточки нескольких дорожек параллельно.
+        
+        Одновременно выполняется не более `concurrency` запросов.
+        
+        Args:
+            lanes: Дорожки
+            concurrency: Максимальное количество одновременных запросов
+            **filters: Аргументы get_cards (all_pages и фильтры API)
+        
+        Returns:
+            Списки карточек в порядке дорожек
+        """
+        return await _gather_bounded(lambda lane: lane.get_cards(**filters), lanes, concurrency)
+    
+    def iter_cards(self, **filters) -> AsyncIterator['Card']:
+        """
+        Перебрать все карточки дорожки по мере загрузки страниц (см. KaitenClient.iter_cards).
+        
+        Args:
+            **filters: Фильтры get_cards (limit и offset задаются автоматически)
+        """
+        return self._client.iter_cards(board_id=self.board_id, lane_id=self.id, **filters)
+    
     async def create_card(
         self,
         title: str,
@@ -2,7 +2,9 @@
 Модель для работы с участниками карточек Kaiten.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..batch import _gather_bounded
+from ..config import KaitenConfig
 from .base import KaitenObject
 
 
@@ -11,6 +13,8 @@ class Member(KaitenObject):
     Класс для работы с участниками карточек Kaiten.
     """
     
+    __slots__ = ()
+    
     @property
     def user_id(self) -> Optional[int]:
         """ID пользователя."""
@@ -43,15 +47,45 @@ class Member(KaitenObject):
     
     async def refresh(self) -> 'Member':
         """Обновить данные участника из API."""
-        # Для участников нет отдельного эндпоинта получения по ID
-        # Нужно получить всех участников карточки и найти нужного
-        members_data = await self._client.get_card_members(self.card_id)
-        for member_data in members_data:
-            if member_data.get('user_id') == self.user_id:
-                self._data = member_data
-                break
+        # Для участников нет отдельного эндпоинта получения по ID:
+        # загружаются все участники карточки
+        await Member.refresh_all((self,))
         return self
     
+    @classmethod
+    async def refresh_all(cls, members: Iterable['Member'],
+                          concurrency: int = KaitenConfig.BULK_CONCURRENCY) -> List['Member']:
+        """
+        Обновить данные нескольких участников из API.
+        
+        Участники группируются по карточкам: список участников каждой карточки
+        загружается один раз, разные карточки - параллельно, не более
+        `concurrency` запросов одновременно.
+        
+        Args:
+            members: Участники карточек
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Те же участники в исходном порядке
+        """
+        members = list(members)
+        groups: Dict[int, List['Member']] = {}
+        for member in members:
+            groups.setdefault(member.card_id, []).append(member)
+        
+        async def refresh_group(entry: Tuple[int, List['Member']]) -> None:
+            card_id, group = entry
+            fresh = await group[0]._client.get_card_members(card_id)
+            rows = {member._data.get('user_id'): member._data for member in fresh}
+            for member in group:
+                row = rows.get(member.user_id)
+                if row is not None:
+                    member._data = row
+        
+        await _gather_bounded(refresh_group, groups.items(), concurrency)
+        return members
+    
     async def remove(self) -> bool:
         """
         Удалить участника из карточки.
@@ -66,9 +100,9 @@ class Member(KaitenObject):
         """Участники не поддерживают обновление через API."""
         raise NotImplementedError("Members cannot be updated via API")
     
-    def delete(self) -> bool:
-        """Удалить участника (алиас для remove)."""
-        return self.remove()
+    async def delete(self) -> bool:
+        """Удалить участника (асинхронный алиас для remove)."""
+        return await self.remove()
     
     def __str__(self) -> str:
         """Строковое представление участника."""
@@ -2,12 +2,9 @@
 Модель для работы с пользовательскими свойствами (custom properties) Kaiten.
 """
 
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Union
 from .base import KaitenObject
 
-if TYPE_CHECKING:
-    pass
-
 
 class Property(KaitenObject):
     """
@@ -16,6 +13,8 @@ class Property(KaitenObject):
     Предоставляет методы для управления пользовательскими свойствами.
     """
     
+    __slots__ = ()
+    
     @property
     def name(self) -> Optional[str]:
         """Название пользовательского свойства."""
@@ -123,8 +122,8 @@ class Property(KaitenObject):
     
     async def refresh(self) -> 'Property':
         """Обновить данные свойства из API."""
-        data = await self._client.get_property(self.id)
-        self._data = data._data
+        prop = await self._client.get_custom_property(self.id)
+        self._data = prop._data
         return self
     
     async def update(self, **fields) -> 'Property':
@@ -132,12 +131,14 @@ class Property(KaitenObject):
         Обновить пользовательское свойство.
         
         Args:
-            **fields: Поля для обновления (name, type, show_on_facade и т.д.)
+            **fields: Поля для обновления (name, show_on_facade, multiline и т.д., см. KaitenClient.update_custom_property)
         
         Returns:
             Обновленное свойство
         """
-        return await self._client.update_property(self.id, **fields)
+        prop = await self._client.update_custom_property(self.id, **fields)
+        self._data = prop._data
+        return self
     
     async def delete(self) -> bool:
         """
@@ -146,7 +147,7 @@ class Property(KaitenObject):
         Returns:
             True если удаление прошло успешно
         """
-        return await self._client.delete_property(self.id)
+        return await self._client.delete_custom_property(self.id)
     
     def __str__(self) -> str:
         """Строковое представление пользовательского свойства."""
@@ -2,7 +2,9 @@
 Модель для работы с пространствами Kaiten.
 """
 
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import Iterable, List, Optional, Dict, Any, Union, Sequence, TYPE_CHECKING
+from ..batch import _gather_bounded
+from ..config import KaitenConfig
 from .base import KaitenObject
 
 if TYPE_CHECKING:
@@ -16,6 +18,8 @@ class Space(KaitenObject):
     Предоставляет методы для управления пространством и получения его досок.
     """
     
+    __slots__ = ()
+    
     @property
     def name(self) -> Optional[str]:
         """Название пространства."""
@@ -118,8 +122,8 @@ class Space(KaitenObject):
     
     async def refresh(self) -> 'Space':
         """Обновить данные пространства из API."""
-        data = await self._client.get_space(self.id)
-        self._data = data
+        space = await self._client.get_space(self.id)
+        self._data = space._data
         return self
     
     async def update(self, **fields) -> 'Space':
@@ -145,7 +149,7 @@ class Space(KaitenObject):
         """
         return await self._client.delete_space(self.id)
     
-    async def get_boards(self) -> List['Board']:
+    async def get_boards(self) -> Sequence['Board']:
         """
         Получить все доски в пространстве.
         
@@ -154,6 +158,23 @@ class Space(KaitenObject):
         """
         return await self._client.get_boards(self.id)
     
+    @classmethod
+    async def get_boards_for(cls, spaces: Iterable['Space'],
+                             concurrency: int = KaitenConfig.BULK_CONCURRENCY) -> List[Sequence['Board']]:
+        """
+        Получить доски нескольких пространств параллельно.
+        
+        Одновременно выполняется не более `concurrency` запросов.
+        
+        Args:
+            spaces: Пространства
+            concurrency: Максимальное количество одновременных запросов
+        
+        Returns:
+            Списки досок в порядке пространств
+        """
+        return await _gather_bounded(lambda space: space.get_boards(), spaces, concurrency)
+    
     async def create_board(
         self,
         title: str,
@@ -11,6 +11,8 @@ class Tag(KaitenObject):
     Класс для работы с тегами Kaiten.
     """
     
+    __slots__ = ()
+    
     @property
     def name(self) -> Optional[str]:
         """Название тега."""
@@ -28,8 +30,8 @@ class Tag(KaitenObject):
     
     async def refresh(self) -> 'Tag':
         """Обновить данные тега из API."""
-        data = await self._client.get_tag(self.id)
-        self._data = data
+        tag = await self._client.get_tag(self.id)
+        self._data = tag._data
         return self
     
     async def update(self, **fields) -> 'Tag':
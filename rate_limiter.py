@@ -0,0 +1,112 @@
+"""
+Ограничители частоты запросов для Kaiten API клиента.
+"""
+
+import asyncio
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму token bucket.
+
+    Бакет вмещает до `capacity` токенов и пополняется со скоростью `rate`
+    токенов в секунду. Каждый запрос забирает `cost` токенов; если токенов
+    не хватает, запрос резервирует их в долг и ждёт, пока долг не погасится.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Args:
+            capacity: Максимальное количество токенов (размер всплеска)
+            rate: Скорость пополнения (токенов в секунду)
+        """
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity и rate должны быть положительными")
+
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self.tokens = float(capacity)
+        self.last_refill = None
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        """Забирает `cost` токенов, при необходимости ожидая их пополнения."""
+        now = asyncio.get_running_loop().time()
+        if self.last_refill is None:
+            self.last_refill = now
+
+        # Обновление счётчика не содержит await, поэтому атомарно в рамках event loop
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= cost
+
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def drain(self) -> None:
+        """Обнуляет запас токенов (например, после ответа 429 от сервера)."""
+        self.tokens = min(self.tokens, 0.0)
+
+
+class SlidingWindowLimiter:
+    """
+    Ограничитель частоты запросов по алгоритму sliding window counter.
+
+    Оценка текущей частоты учитывает предыдущее окно пропорционально
+    непрошедшей части текущего окна, что не допускает двойного всплеска
+    на границе окон, характерного для token bucket и фиксированного окна.
+    """
+
+    def __init__(self, limit: int, window_sec: float = 1.0):
+        """
+        Args:
+            limit: Максимальное количество запросов за окно
+            window_sec: Длительность окна в секундах
+        """
+        if limit <= 0 or window_sec <= 0:
+            raise ValueError("limit и window_sec должны быть положительными")
+
+        self.limit = limit
+        self.window_sec = float(window_sec)
+        self.prev_count = 0
+        self.curr_count = 0
+        self.window_start = None
+        # Очередь допуска: ожидающие корутины проходят строго по одной и в порядке прихода
+        self._lock = asyncio.Lock()
+
+    def _roll(self, now: float) -> float:
+        """Сдвигает окна к текущему моменту и возвращает время, прошедшее в текущем окне."""
+        if self.window_start is None:
+            self.window_start = now
+
+        elapsed = now - self.window_start
+        if elapsed >= self.window_sec:
+            windows_passed = int(elapsed // self.window_sec)
+            self.prev_count = self.curr_count if windows_passed == 1 else 0
+            self.curr_count = 0
+            self.window_start += windows_passed * self.window_sec
+            elapsed = now - self.window_start
+        return elapsed
+
+    async def acquire(self) -> None:
+        """Регистрирует запрос, при необходимости ожидая освобождения лимита."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                elapsed = self._roll(loop.time())
+                weight = 1.0 - elapsed / self.window_sec
+                if self.prev_count * weight + self.curr_count < self.limit:
+                    self.curr_count += 1
+                    return
+
+                # Ждём, пока вклад предыдущего окна не уменьшится достаточно,
+                # либо до конца текущего окна, если оно уже заполнено само по себе
+                if self.curr_count >= self.limit or not self.prev_count:
+                    wait = self.window_sec - elapsed
+                else:
+                    free_weight = (self.limit - self.curr_count) / self.prev_count
+                    wait = self.window_sec * (weight - free_weight) + 1e-6
+                await asyncio.sleep(max(wait, 1e-3))
+
+    def drain(self) -> None:
+        """Считает текущее окно заполненным (например, после ответа 429 от сервера)."""
+        self.curr_count = max(self.curr_count, self.limit)
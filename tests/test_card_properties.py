@@ -0,0 +1,76 @@
+"""
+Значения кастомных свойств карточки: проверка эндпоинта /cards/{id}/properties
+и переход на карточку с дополнительными полями.
+
+Запуск: python -m unittest discover -s tests
+"""
+
+import importlib
+import sys
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+# Пакет клиента - корень репозитория; импортируем его по имени каталога
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT.parent))
+kaiten = importlib.import_module(_ROOT.name)
+
+_PROPERTIES = {'id_1': 'значение'}
+
+
+class CardPropertiesFallbackTest(unittest.IsolatedAsyncioTestCase):
+
+    async def _start(self, probe_response: web.Response) -> None:
+        self.probe_count = 0
+
+        async def probe(request: web.Request) -> web.Response:
+            self.probe_count += 1
+            return probe_response
+
+        async def card(request: web.Request) -> web.Response:
+            return web.json_response({'id': 1, 'properties': _PROPERTIES})
+
+        app = web.Application()
+        app.router.add_get('/api/v1/cards/1/properties', probe)
+        app.router.add_get('/api/v1/cards/1', card)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, '127.0.0.1', 0).start()
+        self.addAsyncCleanup(self.runner.cleanup)
+        host, port = self.runner.addresses[0][:2]
+
+        self.client = kaiten.KaitenClient('token', runtime_config=kaiten.KaitenRuntimeConfig(
+            limit_per_sec=100, max_retries=1))
+        self.client.config._base_url = f'http://{host}:{port}/api/v1'
+        await self.client.initialize()
+        self.addAsyncCleanup(self.client.close)
+
+    async def _assert_falls_back(self, probe_response: web.Response) -> None:
+        await self._start(probe_response)
+        self.assertEqual(await self.client.get_card_properties_values(1), _PROPERTIES)
+        self.assertEqual(await self.client.get_card_properties_values(1), _PROPERTIES)
+        # Отсутствие эндпоинта запоминается: второй вызов его уже не проверяет
+        self.assertEqual(self.probe_count, 1)
+
+    async def test_404_falls_back(self):
+        await self._assert_falls_back(web.Response(status=404))
+
+    async def test_405_falls_back(self):
+        await self._assert_falls_back(web.Response(status=405))
+
+    async def test_400_falls_back(self):
+        await self._assert_falls_back(web.Response(status=400, text='Bad Request'))
+
+    async def test_html_page_falls_back(self):
+        await self._assert_falls_back(web.Response(text='<html>SPA</html>', content_type='text/html'))
+
+    async def test_server_error_is_raised(self):
+        await self._start(web.Response(status=500))
+        with self.assertRaises(kaiten.KaitenServerError):
+            await self.client.get_card_properties_values(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
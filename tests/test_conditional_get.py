@@ -0,0 +1,63 @@
+"""
+Условные GET запросы (If-None-Match / 304 Not Modified).
+
+Запуск: python -m unittest discover -s tests
+"""
+
+import importlib
+import sys
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+# Пакет клиента - корень репозитория; импортируем его по имени каталога
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT.parent))
+kaiten = importlib.import_module(_ROOT.name)
+
+_ETAG = '"v1"'
+
+
+class ConditionalGetTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.not_modified = 0
+
+        async def select_value(request: web.Request) -> web.Response:
+            if request.headers.get('If-None-Match') == _ETAG:
+                self.not_modified += 1
+                return web.Response(status=304)
+            return web.json_response({'id': 2, 'value': 'Готово', 'tags': ['a']}, headers={'ETag': _ETAG})
+
+        app = web.Application()
+        app.router.add_get('/api/v1/company/custom-properties/1/select-values/2', select_value)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, '127.0.0.1', 0).start()
+        host, port = self.runner.addresses[0][:2]
+
+        self.client = kaiten.KaitenClient('token', runtime_config=kaiten.KaitenRuntimeConfig(limit_per_sec=100))
+        self.client.config._base_url = f'http://{host}:{port}/api/v1'
+        await self.client.initialize()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def test_mutating_result_does_not_change_later_304_responses(self):
+        first = await self.client.get_property_select_value(1, 2)
+        first['value'] = 'изменено'
+        first['tags'].append('b')
+
+        second = await self.client.get_property_select_value(1, 2)
+        second['tags'].append('c')
+        third = await self.client.get_property_select_value(1, 2)
+
+        self.assertEqual(self.not_modified, 2)
+        self.assertEqual(third, {'id': 2, 'value': 'Готово', 'tags': ['a']})
+        self.assertIsNot(second, third)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Объединение одновременных GET запросов и сброс сохранённых ответов при изменениях.
+
+Запуск: python -m unittest discover -s tests
+"""
+
+import asyncio
+import importlib
+import sys
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+# Пакет клиента - корень репозитория; импортируем его по имени каталога
+_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_ROOT.parent))
+kaiten = importlib.import_module(_ROOT.name)
+
+
+class FakeKaitenServer:
+    """Локальный сервер с одной карточкой: GET отвечает с задержкой, PATCH меняет её сразу."""
+
+    def __init__(self, get_delay: float = 0.2):
+        self.get_delay = get_delay
+        self.card = {'id': 1, 'title': 'old'}
+        self.get_count = 0
+        self._runner = None
+        self.base_url = None
+
+    async def _get_card(self, request: web.Request) -> web.Response:
+        self.get_count += 1
+        # Ответ содержит состояние на момент начала запроса
+        body = dict(self.card)
+        await asyncio.sleep(self.get_delay)
+        return web.json_response(body)
+
+    async def _patch_card(self, request: web.Request) -> web.Response:
+        self.card.update(await request.json())
+        return web.json_response(self.card)
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/api/v1/cards/1', self._get_card)
+        app.router.add_patch('/api/v1/cards/1', self._patch_card)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f'http://{host}:{port}/api/v1'
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+class ReadAfterWriteTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = FakeKaitenServer()
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def _client(self, **runtime) -> 'kaiten.KaitenClient':
+        client = kaiten.KaitenClient('token', runtime_config=kaiten.KaitenRuntimeConfig(
+            limit_per_sec=100, **runtime))
+        client.config._base_url = self.server.base_url
+        await client.initialize()
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def _read_during_write(self, client) -> 'kaiten.models.Card':
+        # GET начат до изменения и ещё выполняется, когда изменение завершилось
+        early = asyncio.ensure_future(client.get_card(1))
+        await asyncio.sleep(0.05)
+        await client.update_card(1, title='new')
+        card = await client.get_card(1)
+        self.assertEqual((await early).title, 'old')
+        return card
+
+    async def test_get_after_write_does_not_join_earlier_get(self):
+        client = await self._client()
+        card = await self._read_during_write(client)
+        self.assertEqual(card.title, 'new')
+        self.assertEqual(self.server.get_count, 2)
+
+    async def test_get_started_before_write_is_not_cached(self):
+        client = await self._client(response_cache=True)
+        early = asyncio.ensure_future(client.get_card(1))
+        await asyncio.sleep(0.05)
+        await client.update_card(1, title='new')
+        # Ранний GET завершается после изменения и не должен попасть в кэш
+        self.assertEqual((await early).title, 'old')
+        card = await client.get_card(1)
+        self.assertEqual(card.title, 'new')
+
+    async def test_concurrent_gets_are_still_coalesced(self):
+        client = await self._client()
+        first, second = await asyncio.gather(client.get_card(1), client.get_card(1))
+        self.assertEqual(first.title, second.title)
+        self.assertEqual(self.server.get_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()